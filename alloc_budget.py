@@ -0,0 +1,200 @@
+import argparse
+import os
+import random
+import sys
+import tempfile
+import tracemalloc
+
+# Headless allocation budget check.
+#
+# Runs the real game loop for a fixed number of frames with a seeded RNG and
+# scripted input, counting new Surfaces (constructor, pygame.transform results
+# and copies/conversions of counted Surfaces), SysFont lookups, Font creations
+# and Font.render calls per frame, and measuring Python allocations per frame
+# with tracemalloc. Exits non-zero when a budget is exceeded, so per-frame
+# font creation and similar regressions get caught.
+#
+#   python alloc_budget.py [--frames 600] [--seed 1]
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ.setdefault('DROPGAME_DATA_DIR', tempfile.mkdtemp(prefix='dropgame-budget-'))
+
+import pygame
+
+# Budgets apply after warm-up (fonts for every letter size, sprite sheets etc.
+# are created during the first frames).
+BUDGETS = {
+    'sysfont_calls': 0,           # total: fonts are resolved through fonts.get_font
+    'fonts_created': 0,           # total: every size in use has been seen by then
+    'surfaces_per_frame': 8,      # worst frame: a few new cached variants/strings,
+    'renders_per_frame': 6,       # never one per letter or particle
+    'alloc_kib_per_frame': 64,    # worst frame, tracemalloc peak above frame start
+    'retained_kib': 512,          # Python memory still held at the end vs. end of warm-up
+}
+
+WARMUP_FRAMES = 120
+HARD_BUTTON = (530, 505)
+
+counters = {'surfaces': 0, 'sysfont': 0, 'fonts': 0, 'renders': 0}
+
+_Surface = pygame.Surface
+_Font = pygame.font.Font
+_SysFont = pygame.font.SysFont
+
+
+class CountingSurface(_Surface):
+    def __init__(self, *args, **kwargs):
+        counters['surfaces'] += 1
+        super().__init__(*args, **kwargs)
+
+    def copy(self):
+        counters['surfaces'] += 1
+        return super().copy()
+
+    def convert(self, *args):
+        counters['surfaces'] += 1
+        return super().convert(*args)
+
+    def convert_alpha(self, *args):
+        counters['surfaces'] += 1
+        return super().convert_alpha(*args)
+
+
+# Transforms that return a new Surface (the backend's scaled sprite variants)
+TRANSFORMS = ('scale', 'smoothscale', 'rotate', 'rotozoom', 'flip')
+_transforms = {name: getattr(pygame.transform, name) for name in TRANSFORMS}
+
+
+def counting_transform(name):
+    transform = _transforms[name]
+
+    def counted(*args, **kwargs):
+        counters['surfaces'] += 1
+        return transform(*args, **kwargs)
+    return counted
+
+
+class CountingFont(_Font):
+    def __init__(self, *args, **kwargs):
+        counters['fonts'] += 1
+        super().__init__(*args, **kwargs)
+
+    def render(self, *args, **kwargs):
+        counters['renders'] += 1
+        return super().render(*args, **kwargs)
+
+
+def counting_sysfont(*args, **kwargs):
+    counters['sysfont'] += 1
+    return _SysFont(*args, **kwargs)
+
+
+class _FakeClock:
+    """Fixed 60 fps timestep, without sleeping"""
+
+    def tick(self, framerate=0):
+        return 16
+
+
+def run(frames=600, seed=1, warmup=WARMUP_FRAMES):
+    random.seed(seed)
+    input_rng = random.Random(seed)
+
+    pygame.Surface = CountingSurface
+    pygame.font.Font = CountingFont
+    pygame.font.SysFont = counting_sysfont
+    for name in TRANSFORMS:
+        setattr(pygame.transform, name, counting_transform(name))
+
+    # Imported only now so module-level fonts go through the counters too
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    import main as game
+    game.clock = _FakeClock()
+
+    samples = []
+    state = {'frame': 0, 'start_mem': 0, 'start_counts': dict(counters)}
+    warm = {}
+
+    real_flip = pygame.display.flip
+    real_get = pygame.event.get
+
+    def flip():
+        real_flip()
+        current, peak = tracemalloc.get_traced_memory()
+        samples.append({
+            'frame': state['frame'],
+            'alloc': peak - state['start_mem'],
+            **{k: counters[k] - state['start_counts'][k] for k in counters},
+        })
+        state['frame'] += 1
+        if state['frame'] == warmup:
+            warm['counts'] = dict(counters)
+            warm['mem'] = current
+        tracemalloc.reset_peak()
+        state['start_mem'] = tracemalloc.get_traced_memory()[0]
+        state['start_counts'] = dict(counters)
+
+    def get_events():
+        events = real_get()
+        frame = state['frame']
+        if frame == 1:
+            events.append(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=HARD_BUTTON, button=1))
+        elif frame >= frames:
+            events.append(pygame.event.Event(pygame.QUIT))
+        elif frame % 6 == 0:
+            ch = input_rng.choice("abcdefghijklmnopqrstuvwxyz")
+            events.append(pygame.event.Event(pygame.KEYDOWN, key=ord(ch), unicode=ch, mod=0, scancode=0))
+        return events
+
+    pygame.display.flip = flip
+    pygame.event.get = get_events
+    tracemalloc.start()
+    try:
+        game.main(play_music=False)
+        end_mem = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+        pygame.display.flip = real_flip
+        pygame.event.get = real_get
+
+    measured = [s for s in samples if warmup <= s['frame'] < frames]
+    if not measured or 'counts' not in warm:
+        raise RuntimeError(f"only {len(samples)} frames ran; need more than {warmup}")
+    return {
+        'frames': len(measured),
+        'sysfont_calls': counters['sysfont'] - warm['counts']['sysfont'],
+        'fonts_created': counters['fonts'] - warm['counts']['fonts'],
+        'surfaces_per_frame': max(s['surfaces'] for s in measured),
+        'renders_per_frame': max(s['renders'] for s in measured),
+        'alloc_kib_per_frame': max(s['alloc'] for s in measured) / 1024,
+        'retained_kib': (end_mem - warm['mem']) / 1024,
+        'mean_surfaces': sum(s['surfaces'] for s in measured) / len(measured),
+        'mean_renders': sum(s['renders'] for s in measured) / len(measured),
+        'mean_alloc_kib': sum(s['alloc'] for s in measured) / len(measured) / 1024,
+    }
+
+
+def check(results, budgets=BUDGETS):
+    """Print results against budgets; return the names of exceeded budgets"""
+    failures = []
+    print(f"Allocation budget ({results['frames']} frames after warm-up):")
+    for name, limit in budgets.items():
+        value = results[name]
+        ok = value <= limit
+        if not ok:
+            failures.append(name)
+        print(f"  {'ok  ' if ok else 'FAIL'} {name:<20} {value:10.1f}  (budget {limit})")
+    print(f"       mean: {results['mean_surfaces']:.1f} surfaces, {results['mean_renders']:.1f} renders, "
+          f"{results['mean_alloc_kib']:.1f} KiB per frame")
+    return failures
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Headless per-frame allocation budget check")
+    parser.add_argument('--frames', type=int, default=600)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--warmup', type=int, default=WARMUP_FRAMES)
+    args = parser.parse_args()
+    failures = check(run(args.frames, args.seed, args.warmup))
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,161 @@
+import multiprocessing
+import os
+import queue
+import shutil
+import subprocess
+import time
+from multiprocessing import shared_memory
+
+import pygame
+
+RING_SLOTS = 8
+
+
+def _encoder_main(slot_names, size, masks, pixel_format, out_dir, encoder, fps, full_q, done_q):
+    """Encoder process: turn filled ring slots into files, hand slots back"""
+    slots = [shared_memory.SharedMemory(name=name) for name in slot_names]
+    width, height = size
+    frame_bytes = width * height * 4
+    # Reused for every PNG; its masks match the captured bytes and ignore the X byte
+    staging = pygame.Surface(size, 0, 32, masks) if encoder == 'png' else None
+    ffmpeg = None
+    if encoder == 'ffmpeg':
+        ffmpeg = subprocess.Popen(
+            ['ffmpeg', '-loglevel', 'error', '-y',
+             '-f', 'rawvideo', '-pix_fmt', pixel_format, '-s', f'{width}x{height}',
+             '-r', str(fps), '-i', '-',
+             '-c:v', 'libx264', '-preset', 'veryfast', '-pix_fmt', 'yuv420p',
+             os.path.join(out_dir, 'capture.mp4')],
+            stdin=subprocess.PIPE)
+
+    try:
+        while True:
+            item = full_q.get()
+            if item is None:
+                break
+            index, frame_no = item
+            data = slots[index].buf[:frame_bytes]
+            if ffmpeg:
+                ffmpeg.stdin.write(data)
+            elif staging:
+                pixels = memoryview(staging.get_view('1')).cast('B')
+                pixels[:] = data
+                pixels.release()
+                pygame.image.save(staging, os.path.join(out_dir, f'frame_{frame_no:06d}.png'))
+            else:
+                with open(os.path.join(out_dir, f'frame_{frame_no:06d}.{pixel_format}'), 'wb') as f:
+                    f.write(data)
+            data.release()
+            done_q.put(index)
+    finally:
+        if ffmpeg:
+            ffmpeg.stdin.close()
+            ffmpeg.wait()
+        for slot in slots:
+            slot.close()
+
+
+class FrameCapture:
+    """Records presented frames without stalling the game loop.
+
+    Frames are copied straight out of the display surface's pixel buffer into
+    a ring of shared-memory slots, and a separate encoder process writes them
+    out (through ffmpeg when it is installed, otherwise as a PNG or raw
+    sequence). If every slot is still waiting on the encoder the frame is
+    dropped and counted rather than waited for.
+
+    PNG encoding is slower than a frame, so image sequences are spread over
+    several encoder processes; ffmpeg needs its frames in order and gets one.
+    """
+
+    def __init__(self, screen, out_dir, encoder='auto', fps=60, slots=RING_SLOTS):
+        if encoder == 'auto':
+            encoder = 'ffmpeg' if shutil.which('ffmpeg') else 'png'
+        self.encoder = encoder
+        workers = 1 if encoder == 'ffmpeg' else max(1, min(3, (os.cpu_count() or 2) - 1))
+        self.out_dir = out_dir
+        self.size = screen.get_size()
+        # 32-bit display surfaces are copied as-is; the fourth byte is padding.
+        # Anything else goes through tobytes() as RGBX.
+        self.direct = screen.get_bitsize() == 32 and screen.get_pitch() == self.size[0] * 4
+        if self.direct:
+            self.masks = tuple(screen.get_masks()[:3]) + (0,)
+        else:
+            self.masks = (0xFF, 0xFF00, 0xFF0000, 0)
+        # Pixel layout name as ffmpeg spells it (little-endian byte order)
+        self.pixel_format = 'bgr0' if self.masks[0] == 0xFF0000 else 'rgb0'
+        frame_bytes = self.size[0] * self.size[1] * 4
+
+        os.makedirs(out_dir, exist_ok=True)
+        self.slots = [shared_memory.SharedMemory(create=True, size=frame_bytes) for _ in range(slots)]
+        self.free = list(range(slots))
+        self.full_q = multiprocessing.Queue()
+        self.done_q = multiprocessing.Queue()
+        self.processes = [
+            multiprocessing.Process(
+                target=_encoder_main,
+                args=([s.name for s in self.slots], self.size, self.masks, self.pixel_format, out_dir,
+                      encoder, fps, self.full_q, self.done_q),
+                daemon=True)
+            for _ in range(workers)
+        ]
+        for process in self.processes:
+            process.start()
+
+        # Counters
+        self.frames = 0
+        self.captured = 0
+        self.dropped = 0
+        self.max_depth = 0
+        self.grab_seconds = 0.0
+
+    @property
+    def depth(self):
+        """Frames handed to the encoder and not yet written"""
+        return len(self.slots) - len(self.free)
+
+    def _reclaim(self):
+        while True:
+            try:
+                self.free.append(self.done_q.get_nowait())
+            except queue.Empty:
+                return
+
+    def grab(self, screen):
+        """Copy the frame just presented; call right after display.flip()"""
+        start = time.perf_counter()
+        self.frames += 1
+        self._reclaim()
+        if not self.free:
+            self.dropped += 1
+            return
+
+        index = self.free.pop()
+        buf = self.slots[index].buf
+        if self.direct:
+            view = memoryview(screen.get_view('1')).cast('B')
+            buf[:len(view)] = view
+            view.release()
+        else:
+            data = pygame.image.tobytes(screen, 'RGBX')
+            buf[:len(data)] = data
+        self.full_q.put((index, self.frames))
+        self.captured += 1
+        self.max_depth = max(self.max_depth, self.depth)
+        self.grab_seconds += time.perf_counter() - start
+
+    def close(self):
+        for _ in self.processes:
+            self.full_q.put(None)
+        for process in self.processes:
+            process.join(timeout=30)
+        for slot in self.slots:
+            slot.close()
+            slot.unlink()
+
+    def report(self):
+        mean_grab = self.grab_seconds / max(self.captured, 1) * 1000
+        print(f"Capture ({self.encoder} x{len(self.processes)} -> {self.out_dir}):")
+        print(f"  frames {self.frames}, captured {self.captured}, dropped {self.dropped}")
+        print(f"  encoder queue depth max {self.max_depth}/{len(self.slots)}, "
+              f"copy {mean_grab:.2f} ms/frame")
@@ -20,3 +20,22 @@ DANGER_RED = (255, 45, 85)
 
 # Assets Directory
 ASSETS_DIR = os.path.join(os.path.dirname(__file__), 'assets')
+
+# Word mode dictionary (one word per line)
+WORD_LIST_PATH = os.path.join(ASSETS_DIR, 'words.txt')
+
+# Multiplayer race
+RACE_PORT = 50007
+RACE_TICK_RATE = 20  # state updates per second
+
+# Runtime metrics export (StatsD over UDP)
+STATSD_PORT = 8125
+
+# Bundled fonts (optional). A TTF placed here as '<Name>.ttf' or '<Name>-Bold.ttf'
+# is loaded directly by path and skips the system font scan entirely.
+FONTS_DIR = os.path.join(ASSETS_DIR, 'fonts')
+
+# Per-user data (caches, saved progress)
+DATA_DIR = os.environ.get('DROPGAME_DATA_DIR',
+                          os.path.join(os.path.expanduser('~'), '.dropgame'))
+FONT_CACHE_PATH = os.path.join(DATA_DIR, 'font_cache.json')
@@ -0,0 +1,65 @@
+import time
+from collections import namedtuple
+
+# Gameplay publishes these; subscribers (audio, effects, HUD, stats) react once
+# per frame. Events are plain tuples so identical ones compare equal and can
+# be coalesced.
+Hit = namedtuple('Hit', 'char x y points combo reaction')  # reaction: seconds since spawn
+Mistake = namedtuple('Mistake', 'char')              # typed a key nothing matched (None: failed word submit)
+Miss = namedtuple('Miss', 'char')                    # a letter crossed the danger line
+SpeedChange = namedtuple('SpeedChange', 'up manual')
+PowerUpCollected = namedtuple('PowerUpCollected', 'type symbol color')
+BonusTime = namedtuple('BonusTime', 'seconds')
+Burst = namedtuple('Burst', 'sender')
+
+
+class EventBus:
+    """Per-frame game event queue.
+
+    publish() only appends to a list, so the input path stays short. drain()
+    runs once per frame: it coalesces runs of identical events into
+    (event, count) pairs, keeping publish order, hands the whole batch to
+    every subscriber in subscription order and records how long each
+    subscriber took.
+    """
+
+    def __init__(self):
+        self.pending = []
+        self.subscribers = []
+        self.timings = {}  # name -> [calls, total seconds, worst seconds]
+
+    def subscribe(self, name, handler):
+        """Register handler(batch), where batch is a list of (event, count)"""
+        self.subscribers.append((name, handler))
+        self.timings[name] = [0, 0.0, 0.0]
+
+    def publish(self, event):
+        self.pending.append(event)
+
+    def drain(self):
+        if not self.pending:
+            return
+        # Only back-to-back duplicates merge, so the batch keeps publish order
+        # (race inputs, practice and the keystroke log depend on it)
+        batch = []
+        for event in self.pending:
+            if batch and batch[-1][0] == event:
+                batch[-1][1] += 1
+            else:
+                batch.append([event, 1])
+        self.pending = []
+
+        for name, handler in self.subscribers:
+            start = time.perf_counter()
+            handler(batch)
+            elapsed = time.perf_counter() - start
+            timing = self.timings[name]
+            timing[0] += 1
+            timing[1] += elapsed
+            timing[2] = max(timing[2], elapsed)
+
+    def report(self):
+        print("Event subscribers:")
+        for name, (calls, total, worst) in self.timings.items():
+            mean = total / calls if calls else 0.0
+            print(f"  {name:<8} {calls:6d} frames  mean {mean * 1000:7.3f} ms  worst {worst * 1000:7.3f} ms")
@@ -0,0 +1,85 @@
+import json
+import os
+import pygame
+from config import FONTS_DIR, FONT_CACHE_PATH
+
+# pygame.font.SysFont scans every system font directory (or shells out to
+# fc-list) the first time it is called. That scan dominates cold start, so we
+# resolve each (name, bold) pair to a file path once, remember the answer on
+# disk, and afterwards open fonts directly with pygame.font.Font(path, size).
+
+_fonts = {}
+_font_paths = None
+_font_paths_dirty = False
+
+
+def _load_path_cache():
+    global _font_paths
+    if _font_paths is None:
+        _font_paths = {}
+        try:
+            with open(FONT_CACHE_PATH, 'r', encoding='utf-8') as f:
+                _font_paths = json.load(f)
+        except (OSError, ValueError):
+            pass
+    return _font_paths
+
+
+def save_font_cache():
+    """Write newly resolved font paths to disk"""
+    global _font_paths_dirty
+    if not _font_paths_dirty:
+        return
+    try:
+        os.makedirs(os.path.dirname(FONT_CACHE_PATH), exist_ok=True)
+        with open(FONT_CACHE_PATH, 'w', encoding='utf-8') as f:
+            json.dump(_font_paths, f, indent=1)
+        _font_paths_dirty = False
+    except OSError:
+        print("Could not write font cache")
+
+
+def _bundled_font(name, bold):
+    candidates = [f'{name}-Bold.ttf', f'{name}.ttf'] if bold else [f'{name}.ttf']
+    for filename in candidates:
+        path = os.path.join(FONTS_DIR, filename)
+        if os.path.exists(path):
+            return path, bold and not filename.endswith('-Bold.ttf')
+    return None
+
+
+def resolve_font(name, bold=False):
+    """Resolve a font name to (path, fake_bold) without rescanning system fonts"""
+    global _font_paths_dirty
+    bundled = _bundled_font(name, bold)
+    if bundled:
+        return bundled
+
+    cache = _load_path_cache()
+    key = f'{name}|{int(bold)}'
+    entry = cache.get(key)
+    if entry is not None and (entry[0] is None or os.path.exists(entry[0])):
+        return entry[0], entry[1]
+
+    # Cache miss (or the font was uninstalled) - fall back to the slow scan
+    path = pygame.font.match_font(name, bold=bold)
+    # match_font silently returns the regular face when no bold face exists,
+    # in which case SysFont would have emboldened it synthetically.
+    fake_bold = bold and path is not None and path == pygame.font.match_font(name)
+    if path is None:
+        fake_bold = bold
+    cache[key] = [path, fake_bold]
+    _font_paths_dirty = True
+    save_font_cache()
+    return path, fake_bold
+
+
+def get_font(name, size, bold=False):
+    key = (name, size, bold)
+    if key not in _fonts:
+        path, fake_bold = resolve_font(name, bold)
+        font = pygame.font.Font(path, size)
+        if fake_bold:
+            font.set_bold(True)
+        _fonts[key] = font
+    return _fonts[key]
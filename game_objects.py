@@ -1,8 +1,30 @@
 import pygame
 import random
 import math
+import time
 from config import *
 from utils import ease_out_cubic, lerp
+from fonts import get_font
+
+DISC_RADIUS = 32
+
+
+def disc_surface():
+    """White disc; glows and particles are this sprite scaled and tinted"""
+    surf = pygame.Surface((DISC_RADIUS * 2, DISC_RADIUS * 2), pygame.SRCALPHA)
+    pygame.draw.circle(surf, WHITE, (DISC_RADIUS, DISC_RADIUS), DISC_RADIUS)
+    return surf
+
+
+def danger_color(y):
+    """White fading to red over the last 100px above the danger line.
+
+    Stepped in 16ths so the surface backend only ever tints a few variants.
+    """
+    if y <= DANGER_LINE_Y - 100:
+        return WHITE
+    danger_factor = int(min(1.0, (y - (DANGER_LINE_Y - 100)) / 100) * 16) / 16
+    return (255, int(lerp(255, 69, danger_factor)), int(lerp(255, 58, danger_factor)))
 
 class Particle:
     def __init__(self, x, y, color, velocity=None):
@@ -20,15 +42,14 @@ class Particle:
         self.velocity[1] += 0.2  # Gravity
         self.lifetime -= dt
 
-    def draw(self, surface):
+    def draw(self, backend):
         if self.lifetime > 0:
             alpha = int(255 * (self.lifetime / self.max_lifetime))
             size = int(self.size * (self.lifetime / self.max_lifetime))
             if size > 0:
-                s = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-                color_with_alpha = (*self.color[:3], alpha)
-                pygame.draw.circle(s, color_with_alpha, (size, size), size)
-                surface.blit(s, (int(self.x - size), int(self.y - size)))
+                backend.blit(backend.sprite('disc', disc_surface),
+                             (int(self.x - size), int(self.y - size)),
+                             (size * 2, size * 2), alpha, self.color)
 
 
 class FloatingText:
@@ -47,28 +68,28 @@ class FloatingText:
         progress = 1 - (self.lifetime / self.max_lifetime)
         self.y = self.start_y - ease_out_cubic(progress) * 50
 
-    def draw(self, surface):
+    def draw(self, backend):
         if self.lifetime > 0:
+            # Rendered once; the fade is per-draw alpha
             alpha = int(255 * (self.lifetime / self.max_lifetime))
-            text_surf = self.font.render(self.text, True, self.color)
-            text_surf.set_alpha(alpha)
-            surface.blit(text_surf, (int(self.x), int(self.y)))
+            backend.blit(backend.text(self.font, self.text, self.color),
+                         (int(self.x), int(self.y)), alpha=alpha)
 
 
 class PowerUp:
+    ROTATION_STEPS = 72  # update() turns 5 degrees a frame
+    _sprites = {}        # type -> [(surface, half_width, half_height)] per rotation step
+
     def __init__(self, type_name):
         self.type = type_name
         self.x = random.randint(50, SCREEN_WIDTH - 50)
         self.y = 0
         self.speed = 2
         self.size = 25
+        self.half_width = self.size + 10  # including the glow
         self.angle = 0
 
-        # We need a font for the symbol, but we can't easily pass it in __init__ without changing signature everywhere
-        # For now, let's create a small font locally or assume it's passed.
-        # Better: Pass font in draw() or use a static/class variable.
-        # Let's use a default font for now if not provided, but ideally we pass it.
-        # The original code used a global 'font'. Let's assume we'll pass font to draw().
+        # The symbol font is passed to bake_sprites()/draw() rather than stored here
 
         if type_name == "slow":
             self.color = VIBRANT_CYAN
@@ -84,35 +105,65 @@ class PowerUp:
         self.y += self.speed
         self.angle += 5
 
-    def draw(self, surface, font):
-        # Draw rotating glow
-        for i in range(3):
-            s = pygame.Surface((self.size * 2 + i * 10, self.size * 2 + i * 10), pygame.SRCALPHA)
-            color_with_alpha = (*self.color[:3], 50)
-            pygame.draw.circle(s, color_with_alpha, (self.size + i * 5, self.size + i * 5), self.size + i * 5)
-            surface.blit(s, (int(self.x - self.size - i * 5), int(self.y - self.size - i * 5)))
+    @classmethod
+    def bake_sprites(cls, font):
+        """Pre-render every power-up type at each rotation step.
+
+        Glow, disc, ring and symbol are composited once per type and rotated
+        into ROTATION_STEPS frames, so draw() is a single blit with no
+        per-frame allocation.
+        """
+        for type_name in ("slow", "time", "freeze"):
+            if type_name in cls._sprites:
+                continue
+            proto = cls(type_name)
+            size = proto.size
+            radius = size + 10  # outermost glow ring
+            base = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            center = (radius, radius)
 
-        # Draw power-up circle
-        pygame.draw.circle(surface, self.color, (int(self.x), int(self.y)), self.size)
-        pygame.draw.circle(surface, WHITE, (int(self.x), int(self.y)), self.size, 3)
+            # draw.circle overwrites alpha, so each glow ring goes on its own
+            # surface and is blended in, layering like the old per-frame blits
+            for i in range(3):
+                ring_radius = size + i * 5
+                ring = pygame.Surface((ring_radius * 2, ring_radius * 2), pygame.SRCALPHA)
+                pygame.draw.circle(ring, (*proto.color[:3], 50), (ring_radius, ring_radius), ring_radius)
+                base.blit(ring, (radius - ring_radius, radius - ring_radius))
+            pygame.draw.circle(base, proto.color, center, size)
+            pygame.draw.circle(base, WHITE, center, size, 3)
+            symbol_surf = font.render(proto.symbol, True, WHITE)
+            base.blit(symbol_surf, (radius - symbol_surf.get_width() // 2,
+                                    radius - symbol_surf.get_height() // 2))
 
-        # Draw symbol
-        symbol_surf = font.render(self.symbol, True, WHITE)
-        surface.blit(symbol_surf,
-                    (int(self.x - symbol_surf.get_width() // 2),
-                     int(self.y - symbol_surf.get_height() // 2)))
+            frames = []
+            for step in range(cls.ROTATION_STEPS):
+                angle = step * 360 / cls.ROTATION_STEPS
+                rotated = pygame.transform.rotozoom(base, -angle, 1.0)
+                frames.append((rotated, rotated.get_width() // 2, rotated.get_height() // 2))
+            cls._sprites[type_name] = frames
+
+    def draw(self, backend, font):
+        if self.type not in self._sprites:
+            self.bake_sprites(font)
+        frames = self._sprites[self.type]
+        sprite, half_w, half_h = frames[int(self.angle * self.ROTATION_STEPS / 360) % self.ROTATION_STEPS]
+        backend.blit(backend.upload(sprite), (int(self.x) - half_w, int(self.y) - half_h))
 
 
 class FallingLetter:
-    def __init__(self, speed_multiplier=1.0):
-        self.char = random.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZ")
-        self.x = random.randint(50, SCREEN_WIDTH - 50)
+    def __init__(self, speed_multiplier=1.0, rng=random, char=None):
+        # rng lets multiplayer races share one seeded spawn stream;
+        # char lets practice mode pick the letter
+        self.char = char or rng.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+        self.x = rng.randint(50, SCREEN_WIDTH - 50)
         self.y = -20
+        self.half_width = 20
         self.target_y = self.y
-        self.speed = random.uniform(1, 3) * speed_multiplier
+        self.speed = rng.uniform(1, 3) * speed_multiplier
         self.size_scale = 1.0
-        self.angle = random.uniform(-5, 5)
+        self.angle = rng.uniform(-5, 5)
         self.spawn_time = 0
+        self.spawned_at = time.time()  # wall clock, for reaction times
         self.pulse = 0
 
     def update(self, dt, is_frozen=False):
@@ -131,41 +182,60 @@ class FallingLetter:
             danger_factor = (self.y - (DANGER_LINE_Y - 100)) / 100
             self.size_scale = 1.0 + 0.2 * math.sin(self.pulse) * danger_factor
 
-    def draw(self, surface):
-        # Calculate color based on danger level
-        if self.y > DANGER_LINE_Y - 100:
-            danger_factor = min(1.0, (self.y - (DANGER_LINE_Y - 100)) / 100)
-            color = (
-                int(lerp(255, 255, danger_factor)),
-                int(lerp(255, 69, danger_factor)),
-                int(lerp(255, 58, danger_factor))
-            )
-        else:
-            color = WHITE
+    def draw(self, backend):
+        scale = self.size_scale
 
         # Draw glow effect
-        glow_size = int(40 * self.size_scale)
-        glow_surf = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
-        pygame.draw.circle(glow_surf, (*VIBRANT_CYAN[:3], 30), (glow_size, glow_size), glow_size)
-        surface.blit(glow_surf, (int(self.x - glow_size), int(self.y - glow_size)))
-
-        # Draw letter with shadow
-        # Note: We need to create fonts here or pass them. Creating fonts every frame is bad.
-        # But FallingLetter needs dynamic size. Pygame font creation is somewhat expensive.
-        # Optimization: Cache fonts or use a limited set of sizes.
-        # For this refactor, I'll keep it as is (creating font) to match original behavior,
-        # but ideally we'd have a FontManager.
-        letter_font = pygame.font.SysFont('Arial', int(36 * self.size_scale), bold=True)
+        glow_size = int(40 * scale) * 2
+        backend.draw(backend.sprite('disc', disc_surface), (self.x, self.y),
+                     (glow_size, glow_size), 30, VIBRANT_CYAN)
+
+        # The glyph is rendered once in white at full size; the spawn and
+        # danger pulses scale it and the danger color tints it
+        glyph = backend.text(get_font('Arial', 36, bold=True), self.char)
+        size = (int(glyph.width * scale), int(glyph.height * scale))
 
         # Shadow
-        shadow_surf = letter_font.render(self.char, True, (0, 0, 0, 100))
-        surface.blit(shadow_surf, (int(self.x - shadow_surf.get_width() // 2 + 2),
-                                   int(self.y - shadow_surf.get_height() // 2 + 2)))
+        backend.draw(glyph, (self.x + 2, self.y + 2), size, 100, (0, 0, 0))
 
         # Main letter
-        text_surf = letter_font.render(self.char, True, color)
-        surface.blit(text_surf, (int(self.x - text_surf.get_width() // 2),
-                                int(self.y - text_surf.get_height() // 2)))
+        backend.draw(glyph, (self.x, self.y), size, color=danger_color(self.y))
+
+
+class FallingWord(FallingLetter):
+    """A whole word falling in word mode. `char` holds the full word."""
+
+    def __init__(self, word, speed_multiplier=1.0, rng=random):
+        super().__init__(speed_multiplier, rng)
+        self.char = word
+        self.half_width = min(len(word) * 10 + 20, SCREEN_WIDTH // 2 - 10)
+        self.x = rng.randint(self.half_width, SCREEN_WIDTH - self.half_width)
+        # Words take longer to type than single letters
+        self.speed = rng.uniform(0.5, 1.5) * speed_multiplier
+
+    def draw(self, backend, typed_count=0):
+        scale = self.size_scale
+        word_font = get_font('Arial', 28, bold=True)
+        word = backend.text(word_font, self.char)
+        rest = backend.text(word_font, self.char[typed_count:]) if typed_count < len(self.char) else None
+        width = int(word.width * scale)
+        height = int(word.height * scale)
+        rest_width = int(rest.width * scale) if rest else 0
+
+        # Glow behind the whole word, brighter while it is being typed
+        glow_alpha = 70 if typed_count else 30
+        backend.draw(backend.sprite('disc', disc_surface), (self.x, self.y),
+                     (width + 30, height + 20), glow_alpha, VIBRANT_CYAN)
+
+        left = int(self.x - width // 2)
+        top = int(self.y - height // 2)
+        backend.blit(word, (left + 2, top + 2), (width, height), 100, (0, 0, 0))
+        if typed_count:
+            typed = backend.text(word_font, self.char[:typed_count])
+            backend.blit(typed, (left, top), (width - rest_width, height), color=VIBRANT_GOLD)
+        if rest:
+            backend.blit(rest, (left + width - rest_width, top), (rest_width, height),
+                         color=danger_color(self.y))
 
 
 class ScreenShake:
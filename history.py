@@ -0,0 +1,191 @@
+import array
+import json
+import os
+import sqlite3
+import time
+from config import DATA_DIR
+
+HISTORY_PATH = os.path.join(DATA_DIR, 'history.sqlite3')
+RECENT_SCORES = 10
+
+KEY_HIT, KEY_MISTAKE = 1, 2
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    player TEXT NOT NULL,
+    difficulty TEXT NOT NULL,
+    started_at REAL NOT NULL,
+    duration REAL NOT NULL,
+    score INTEGER NOT NULL,
+    correct INTEGER NOT NULL,
+    mistakes INTEGER NOT NULL,
+    max_combo INTEGER NOT NULL,
+    keystrokes BLOB
+);
+CREATE INDEX IF NOT EXISTS sessions_by_player ON sessions (player, difficulty, started_at);
+CREATE INDEX IF NOT EXISTS sessions_by_date ON sessions (started_at);
+
+CREATE TABLE IF NOT EXISTS session_letters (
+    session_id INTEGER NOT NULL REFERENCES sessions (id),
+    letter TEXT NOT NULL,
+    hits INTEGER NOT NULL,
+    typed_mistakes INTEGER NOT NULL,
+    missed INTEGER NOT NULL,
+    PRIMARY KEY (session_id, letter)
+);
+
+-- Rolling aggregates, updated in the same transaction as each new session so
+-- the start and results screens never have to scan the history.
+CREATE TABLE IF NOT EXISTS player_totals (
+    player TEXT NOT NULL,
+    difficulty TEXT NOT NULL,
+    sessions INTEGER NOT NULL,
+    best_score INTEGER NOT NULL,
+    best_combo INTEGER NOT NULL,
+    recent_scores TEXT NOT NULL,
+    PRIMARY KEY (player, difficulty)
+);
+CREATE TABLE IF NOT EXISTS player_letters (
+    player TEXT NOT NULL,
+    letter TEXT NOT NULL,
+    hits INTEGER NOT NULL,
+    errors INTEGER NOT NULL,
+    PRIMARY KEY (player, letter)
+);
+"""
+
+
+class KeystrokeLog:
+    """Compact per-keystroke timing for one session.
+
+    Each keystroke is three entries in an unsigned int array: milliseconds
+    since the session started, the key's code point and KEY_HIT/KEY_MISTAKE.
+    The whole log is stored as one BLOB.
+    """
+
+    def __init__(self, start_time):
+        self.start_time = start_time
+        self.data = array.array('I')
+
+    def record(self, key, result, now=None):
+        now = time.time() if now is None else now
+        self.data.extend((int((now - self.start_time) * 1000), ord(key[0]), result))
+
+    def __len__(self):
+        return len(self.data) // 3
+
+    def to_blob(self):
+        return self.data.tobytes()
+
+    @staticmethod
+    def from_blob(blob):
+        data = array.array('I')
+        data.frombytes(blob)
+        return [(data[i], chr(data[i + 1]), data[i + 2]) for i in range(0, len(data), 3)]
+
+
+class SessionHistory:
+    """Local SQLite store of every finished session plus rolling aggregates"""
+
+    def __init__(self, path=HISTORY_PATH):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.db = sqlite3.connect(path)
+        try:
+            self.db.executescript(SCHEMA)
+        except sqlite3.Error:
+            self.db.close()
+            raise
+
+    def close(self):
+        self.db.close()
+
+    def record_session(self, player, difficulty, started_at, duration, score, correct, mistakes,
+                       max_combo, letter_hits, typed_mistakes, missed_letters, keystrokes=None):
+        """Store one session and fold it into the player's aggregates.
+
+        Returns the session id, or None if it couldn't be written.
+        """
+        try:
+            return self._record_session(player, difficulty, started_at, duration, score, correct,
+                                        mistakes, max_combo, letter_hits, typed_mistakes,
+                                        missed_letters, keystrokes)
+        except sqlite3.Error:
+            print("Could not save session to history")
+            return None
+
+    def _record_session(self, player, difficulty, started_at, duration, score, correct, mistakes,
+                        max_combo, letter_hits, typed_mistakes, missed_letters, keystrokes):
+        with self.db:
+            cur = self.db.execute(
+                "INSERT INTO sessions (player, difficulty, started_at, duration, score, correct,"
+                " mistakes, max_combo, keystrokes) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (player, difficulty, started_at, duration, score, correct, mistakes, max_combo,
+                 keystrokes.to_blob() if keystrokes else None))
+            session_id = cur.lastrowid
+
+            # Per-letter tables only; word mode hits and misses are keyed by whole words
+            letters = {c for c in (*letter_hits, *typed_mistakes, *missed_letters) if len(c) == 1}
+            rows = [(session_id, c, letter_hits.get(c, 0), typed_mistakes.get(c, 0), missed_letters.get(c, 0))
+                    for c in sorted(letters)]
+            self.db.executemany("INSERT INTO session_letters VALUES (?, ?, ?, ?, ?)", rows)
+            self.db.executemany(
+                "INSERT INTO player_letters VALUES (?, ?, ?, ?)"
+                " ON CONFLICT (player, letter) DO UPDATE SET"
+                " hits = hits + excluded.hits, errors = errors + excluded.errors",
+                [(player, c, hits, mistyped + missed) for _, c, hits, mistyped, missed in rows])
+
+            row = self.db.execute(
+                "SELECT sessions, best_score, best_combo, recent_scores FROM player_totals"
+                " WHERE player = ? AND difficulty = ?", (player, difficulty)).fetchone()
+            if row:
+                sessions, best_score, best_combo, recent = row[0], row[1], row[2], json.loads(row[3])
+            else:
+                sessions, best_score, best_combo, recent = 0, 0, 0, []
+            recent = (recent + [score])[-RECENT_SCORES:]
+            self.db.execute(
+                "INSERT OR REPLACE INTO player_totals VALUES (?, ?, ?, ?, ?, ?)",
+                (player, difficulty, sessions + 1, max(best_score, score), max(best_combo, max_combo),
+                 json.dumps(recent)))
+        return session_id
+
+    def summary(self, player, difficulty=None):
+        """Precomputed best scores, trend and weakest letters for a player.
+
+        Reads only the aggregate tables: a few rows per player, however many
+        sessions are stored. Returns None if the store can't be read.
+        """
+        try:
+            return self._summary(player, difficulty)
+        except sqlite3.Error:
+            print("Could not read session history")
+            return None
+
+    def _summary(self, player, difficulty):
+        totals = {}
+        for diff, sessions, best_score, best_combo, recent in self.db.execute(
+                "SELECT difficulty, sessions, best_score, best_combo, recent_scores"
+                " FROM player_totals WHERE player = ?", (player,)):
+            totals[diff] = {'sessions': sessions, 'best_score': best_score,
+                            'best_combo': best_combo, 'recent': json.loads(recent)}
+
+        weakest = [letter for letter, in self.db.execute(
+            "SELECT letter FROM player_letters WHERE player = ? AND errors > 0"
+            " ORDER BY (errors + 1.0) / (hits + errors + 2.0) DESC LIMIT 3", (player,))]
+
+        summary = {'totals': totals, 'weakest': weakest, 'trend': None}
+        recent = totals.get(difficulty, {}).get('recent', [])
+        if len(recent) >= 2:
+            # Latest score against the average of the ones before it
+            previous = recent[:-1]
+            summary['trend'] = recent[-1] - sum(previous) / len(previous)
+        return summary
+
+
+def open_history(path=HISTORY_PATH):
+    """SessionHistory at path, or None (with a message) if it can't be opened"""
+    try:
+        return SessionHistory(path)
+    except (OSError, sqlite3.Error):
+        print(f"Could not open session history {path}")
+        return None
@@ -1,45 +1,97 @@
+import time
+_startup_t0 = time.perf_counter()
+
+import argparse
 import pygame
 import random
-import time
 import math
 from collections import defaultdict
 import os
 
-# Initialize pygame first
-pygame.init()
-pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
-
-# Import modules after initialization
 from config import *
-from utils import lerp, ease_out_cubic
+from utils import lerp, ease_out_cubic, hit_points
+from fonts import get_font
+from profiling import StartupProfiler
 from sound_manager import SoundManager
-from game_objects import Particle, FloatingText, PowerUp, FallingLetter, ScreenShake
-from ui import draw_gradient_rect, draw_glow_text, show_start_screen, show_results_screen
-
-# Screen setup
-screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-pygame.display.set_caption("DropGame - Type to Survive!")
+from words import WordMatcher, load_word_list
+from multiplayer import RaceClient
+from music import MusicStreamer
+from practice import PracticeProfile
+from spatial import SpatialHash
+from capture import FrameCapture
+from metrics import MetricsExporter
+from render import BACKENDS, create_backend
+from reaction import ReactionStats
+from history import open_history, KeystrokeLog, KEY_HIT, KEY_MISTAKE
+from events import EventBus, Hit, Mistake, Miss, SpeedChange, PowerUpCollected, BonusTime, Burst
+from game_objects import (Particle, FloatingText, PowerUp, FallingLetter, FallingWord, ScreenShake,
+                          disc_surface)
+from ui import (DANGER_GLOW, danger_line_surface, bar_surface, draw_glow_sprite, gradient_surface,
+                show_start_screen, show_results_screen)
+
+startup_profiler = StartupProfiler(_startup_t0)
+startup_profiler.mark('import')
+
+# Initialize only the subsystems we use. pygame.init() would also bring up
+# joystick, camera and friends, which only adds to cold start.
+pygame.display.init()
+pygame.font.init()
+pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
+startup_profiler.mark('init')
 
-# Fonts
-# We need to initialize fonts here to pass them to objects if needed,
-# or rely on them being created in functions.
-# For main loop, we need fonts for HUD.
-font = pygame.font.SysFont('Arial', 36, bold=True)
-small_font = pygame.font.SysFont('Arial', 24)
-results_font = pygame.font.SysFont('Arial', 48, bold=True)
+# Fonts for the HUD
+font = get_font('Arial', 36, bold=True)
+small_font = get_font('Arial', 24)
+results_font = get_font('Arial', 48, bold=True)
+startup_profiler.mark('font')
+PowerUp.bake_sprites(font)
+startup_profiler.mark('sprites')
 
 # Game clock
 clock = pygame.time.Clock()
 
-def main():
+def main(profile_startup=False, word_list=None, race=None, profile_events=False, play_music=True,
+         practice=None, capture_dir=None, capture_format='auto', history=None, player='player',
+         renderer='surface', metrics=None):
+    # Window and render backend (Surface blits, or SDL textures)
+    if capture_dir and renderer != 'surface':
+        print("Could not capture from the texture renderer, using the surface renderer")
+        renderer = 'surface'
+    backend = create_backend(renderer, (SCREEN_WIDTH, SCREEN_HEIGHT), "DropGame - Type to Survive!")
+    screen = backend.screen
+    startup_profiler.mark('window')
+
     # Initialize Sound Manager
     sound_manager = SoundManager()
+    startup_profiler.mark('sound')
+
+    def on_first_frame():
+        startup_profiler.mark('first_frame')
+        if profile_startup:
+            startup_profiler.report()
 
     # Show start screen
-    difficulty = show_start_screen(screen, clock, sound_manager)
+    summary = history.summary(player) if history else None
+    difficulty = show_start_screen(screen, clock, sound_manager, on_first_frame, summary,
+                                   backend.present_screen)
     if difficulty is None:
+        backend.close()
         return
 
+    # Multiplayer race: everyone spawns from the server's seed
+    if race is not None and not race.wait_until_ready():
+        print("Playing solo")
+        race = None
+
+    # Practice mode biases spawns toward the player's weak letters. Races and
+    # word mode need every letter to come from the shared/word stream instead.
+    if practice and (race or word_list):
+        print("Practice mode is only available for solo letter games")
+        practice = None
+    spawn_rng = random.Random(race.seed) if race else random
+    # Opponent bursts draw from their own stream so they don't shift the shared one
+    burst_rng = random.Random(race.seed + 1) if race else random
+
     # Difficulty settings
     if difficulty == "easy":
         speed_multiplier = 0.7
@@ -66,7 +118,10 @@ def main():
     mistake_count = 0
     typed_mistakes = defaultdict(int)
     missed_letters = defaultdict(int)
+    letter_hits = defaultdict(int)
+    reactions = ReactionStats()
     start_time = time.time()
+    keystrokes = KeystrokeLog(start_time)
 
     # Combo system
     combo = 0
@@ -86,6 +141,174 @@ def main():
     # Background animation
     bg_offset = 0
 
+    # Word mode: whole words fall and typing is matched against a trie of them
+    word_matcher = WordMatcher() if word_list else None
+
+    # Gameplay publishes events; these subscribers handle them once per frame
+    events = EventBus()
+
+    def record_stats(batch):
+        nonlocal correct_count, mistake_count
+        now = time.time()
+        for event, count in batch:
+            kind = type(event)
+            if kind is Hit:
+                correct_count += count
+                letter_hits[event.char] += count
+                recent_performance.extend([(now, "correct")] * count)
+                keystrokes.record(event.char[-1], KEY_HIT, now)
+            elif kind is Mistake:
+                mistake_count += count
+                recent_performance.extend([(now, "mistake")] * count)
+                if event.char is None:
+                    continue
+                typed_mistakes[event.char] += count
+                for _ in range(count):
+                    keystrokes.record(event.char, KEY_MISTAKE, now)
+            elif kind is Miss:
+                mistake_count += count
+                missed_letters[event.char] += count
+
+    def record_reactions(batch):
+        for event, count in batch:
+            if type(event) is Hit and len(event.char) == 1:
+                for _ in range(count):
+                    reactions.record(event.char, event.reaction, DANGER_LINE_Y - event.y)
+
+    def sync_race(batch):
+        for event, count in batch:
+            kind = type(event)
+            if kind in (Hit, Mistake, Miss):
+                for _ in range(count):
+                    race.send(kind.__name__.lower(), event.char)
+
+    def play_audio(batch):
+        # Each sound plays at most once per frame, however many events asked for it
+        names = []
+        for event, _ in batch:
+            kind = type(event)
+            if kind is Hit:
+                name = 'correct' if word_matcher is not None else f'letter_{event.char}'
+            elif kind in (Mistake, Miss):
+                name = 'miss'
+            elif kind is SpeedChange:
+                name = 'speed_up' if event.up else 'speed_down'
+            elif kind in (PowerUpCollected, BonusTime):
+                name = 'powerup'
+            else:
+                continue
+            if name not in names:
+                names.append(name)
+        for name in names:
+            if not sound_manager.play(name) and metrics:
+                metrics.incr('sound_drops')
+
+    def show_effects(batch):
+        mistyped = False
+        for event, count in batch:
+            kind = type(event)
+            if kind is Hit:
+                floating_texts.append(
+                    FloatingText(f"+{event.points}", event.x, event.y, VIBRANT_GOLD, font)
+                )
+                for _ in range(15):
+                    particles.append(Particle(event.x, event.y, VIBRANT_CYAN))
+            elif kind is Mistake:
+                mistyped = True
+                screen_shake.add_trauma(0.3 * count)
+            elif kind is Miss:
+                screen_shake.add_trauma(0.5 * count)
+            elif kind is SpeedChange and event.manual:
+                if event.up:
+                    floating_texts.append(
+                        FloatingText("SPEED UP >>", SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2,
+                                   VIBRANT_CYAN, font)
+                    )
+                else:
+                    floating_texts.append(
+                        FloatingText("<< SLOW DOWN", SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2,
+                                   VIBRANT_GREEN, font)
+                    )
+            elif kind is PowerUpCollected:
+                floating_texts.append(
+                    FloatingText(f"{event.symbol} Power-Up!", SCREEN_WIDTH // 2,
+                               SCREEN_HEIGHT - 150, event.color, font)
+                )
+            elif kind is BonusTime:
+                floating_texts.append(
+                    FloatingText(f"BONUS TIME +{event.seconds}s", SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50,
+                               VIBRANT_GOLD, font)
+                )
+            elif kind is Burst:
+                text = f"BURST! from {event.sender}" if event.sender else "BURST!"
+                floating_texts.append(
+                    FloatingText(text, SCREEN_WIDTH // 2 - (100 if event.sender else 0),
+                               SCREEN_HEIGHT // 2 - 100, DANGER_RED, font)
+                )
+        # One "MISS!" per frame instead of a stack of identical ones
+        if mistyped:
+            floating_texts.append(
+                FloatingText("MISS!", SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2,
+                           DANGER_RED, font)
+            )
+
+    def update_practice(batch):
+        for event, count in batch:
+            kind = type(event)
+            if kind in (Hit, Mistake, Miss):
+                for _ in range(count):
+                    practice.record(event.char, kind is Hit)
+
+    def update_hud(batch):
+        nonlocal combo_display_scale
+        if any(type(event) is Hit for event, _ in batch):
+            combo_display_scale = 1.5
+
+    # Gameplay recording: frames go to an encoder process via shared memory
+    capture = FrameCapture(screen, capture_dir, capture_format) if capture_dir else None
+
+    # Adaptive background music, synthesized off the main thread
+    music = MusicStreamer() if play_music else None
+    if music:
+        music.start()
+
+    events.subscribe('stats', record_stats)
+    events.subscribe('reactions', record_reactions)
+    if race:
+        events.subscribe('race', sync_race)
+    if practice:
+        events.subscribe('practice', update_practice)
+    events.subscribe('audio', play_audio)
+    events.subscribe('effects', show_effects)
+    events.subscribe('hud', update_hud)
+
+    # Static sprites: uploaded once, then scaled, faded and tinted per draw
+    background = backend.sprite('background', lambda: gradient_surface(
+        (SCREEN_WIDTH, SCREEN_HEIGHT), DARK_BG, DARK_BG2))
+    dot = backend.sprite('disc', disc_surface)
+    danger_line = backend.sprite('danger_line', danger_line_surface)
+    bar_width = 200
+    bar_height = 20
+    bar_back = backend.sprite('bar_back', lambda: bar_surface(bar_width, bar_height))
+    bar_fills = [backend.sprite(('bar', c1, c2), lambda: gradient_surface((bar_width, bar_height), c1, c2, False))
+                 for c1, c2 in ((VIBRANT_GREEN, VIBRANT_CYAN), (VIBRANT_GOLD, VIBRANT_GREEN),
+                                (DANGER_RED, VIBRANT_GOLD))]
+
+    # Spatial hash over letters and power-ups, used to spawn into free space
+    grid = SpatialHash()
+
+    def spawn_falling(rng=spawn_rng):
+        if word_matcher is not None:
+            word = FallingWord(rng.choice(word_list), speed_multiplier, rng)
+            word_matcher.add(word)
+        elif practice:
+            word = FallingLetter(speed_multiplier, rng, practice.sample(rng))
+        else:
+            word = FallingLetter(speed_multiplier, rng)
+        word.x = grid.find_spawn_x(word.x, word.y, word.half_width)
+        grid.insert(word)
+        letters.append(word)
+
     while running:
         dt = clock.tick(60) / 1000.0
         current_time = time.time()
@@ -113,18 +336,10 @@ def main():
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_UP:
                     speed_multiplier = min(speed_multiplier + 0.2, 5.0)
-                    sound_manager.play('speed_up')
-                    floating_texts.append(
-                        FloatingText("SPEED UP >>", SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2,
-                                   VIBRANT_CYAN, font)
-                    )
+                    events.publish(SpeedChange(up=True, manual=True))
                 elif event.key == pygame.K_DOWN:
                     speed_multiplier = max(speed_multiplier - 0.2, 0.5)
-                    sound_manager.play('speed_down')
-                    floating_texts.append(
-                        FloatingText("<< SLOW DOWN", SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2,
-                                   VIBRANT_GREEN, font)
-                    )
+                    events.publish(SpeedChange(up=False, manual=True))
 
                 # Typing Logic
                 if event.unicode:
@@ -132,70 +347,63 @@ def main():
                 else:
                     pressed_key = ""
 
-                if 'A' <= pressed_key <= 'Z':
-                    found = False
-                    for letter in letters[:]:
-                        if letter.char == pressed_key:
-                            letters.remove(letter)
-                            correct_count += 1
-                            combo += 1
-                            max_combo = max(max_combo, combo)
-
-                            # Calculate score with combo multiplier
-                            points = 10 * (1 + combo * 0.1)
-                            total_score += int(points)
-
-                            # Hard Mode Burst Spawn
-                            if difficulty == "hard" and combo > 0 and combo % 5 == 0:
-                                for _ in range(3):
-                                    letters.append(FallingLetter(speed_multiplier))
-                                floating_texts.append(
-                                    FloatingText("BURST!", SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 100,
-                                               DANGER_RED, font)
-                                )
-
-                            # Bonus time for 10 combo
-                            if combo > 0 and combo % 10 == 0:
-                                game_duration += 5
-                                sound_manager.play('powerup')
-                                floating_texts.append(
-                                    FloatingText("BONUS TIME +5s", SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50,
-                                               VIBRANT_GOLD, font)
-                                )
-
-                            # Visual feedback
-                            combo_display_scale = 1.5
-                            floating_texts.append(
-                                FloatingText(f"+{int(points)}", letter.x, letter.y,
-                                           VIBRANT_GOLD, font)
-                            )
-
-                            # Audio feedback
-                            sound_manager.play(f'letter_{pressed_key}')
-
-                            # Particle explosion
-                            for _ in range(15):
-                                particles.append(
-                                    Particle(letter.x, letter.y, VIBRANT_CYAN)
-                                )
-
-                            recent_performance.append((current_time, "correct"))
-                            found = True
-                            break
+                if word_matcher is not None and event.key == pygame.K_BACKSPACE:
+                    word_matcher.backspace()
+
+                # Word mode: Enter/Space submits a word that prefixes a longer one
+                submit = (word_matcher is not None and word_matcher.typed
+                          and event.key in (pygame.K_RETURN, pygame.K_SPACE))
+
+                if submit or 'A' <= pressed_key <= 'Z':
+                    if metrics:
+                        metrics.incr('keys')
+                    if submit:
+                        # A failed submit is a mistake, but not on any one letter
+                        pressed_key = None
+                        status, letter = word_matcher.submit()
+                        found = status != "miss"
+                    elif word_matcher is not None:
+                        status, letter = word_matcher.type_char(pressed_key)
+                        found = status != "miss"
+                    else:
+                        letter = next((l for l in letters if l.char == pressed_key), None)
+                        found = letter is not None
+
+                    if letter is not None:
+                        letters.remove(letter)
+                        grid.remove(letter)
+                        combo += 1
+                        max_combo = max(max_combo, combo)
+
+                        # Calculate score with combo multiplier
+                        points = hit_points(combo, len(letter.char))
+                        total_score += points
+                        events.publish(Hit(letter.char, letter.x, letter.y, points, combo,
+                                           current_time - letter.spawned_at))
+
+                        # Hard Mode Burst Spawn (in a race the server sends
+                        # combo bursts to opponents instead, and a local draw
+                        # would shift this player's shared spawn stream)
+                        if difficulty == "hard" and not race and combo > 0 and combo % 5 == 0:
+                            for _ in range(3):
+                                spawn_falling()
+                            events.publish(Burst(sender=None))
+
+                        # Bonus time for 10 combo
+                        if combo > 0 and combo % 10 == 0:
+                            game_duration += 5
+                            events.publish(BonusTime(5))
 
                     if not found:
-                        mistake_count += 1
-                        typed_mistakes[pressed_key] += 1
-                        recent_performance.append((current_time, "mistake"))
                         combo = 0
-                        screen_shake.add_trauma(0.3)
-                        sound_manager.play('miss')
+                        events.publish(Mistake(pressed_key))
 
-                        # Visual feedback for mistake
-                        floating_texts.append(
-                            FloatingText("MISS!", SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2,
-                                       DANGER_RED, font)
-                        )
+        # Multiplayer: bursts from opponents' combos
+        if race:
+            for sender, count in race.poll_bursts():
+                for _ in range(count):
+                    spawn_falling(burst_rng)
+                events.publish(Burst(sender))
 
         # Adaptive difficulty
         recent_performance = [(t, p) for t, p in recent_performance if current_time - t < 15]
@@ -204,61 +412,75 @@ def main():
             accuracy = recent_correct / len(recent_performance)
             if accuracy > 0.85:
                 new_speed = min(speed_multiplier * 1.02, 3.0)
-                if int(new_speed * 10) > int(speed_multiplier * 10): # Only play sound on significant change
-                     sound_manager.play('speed_up')
+                if int(new_speed * 10) > int(speed_multiplier * 10): # Only announce significant changes
+                    events.publish(SpeedChange(up=True, manual=False))
                 speed_multiplier = new_speed
                 spawn_rate = max(spawn_rate * 0.98, 20)
             elif accuracy < 0.6:
                 new_speed = max(speed_multiplier * 0.98, 0.5)
                 if int(new_speed * 10) < int(speed_multiplier * 10):
-                    sound_manager.play('speed_down')
+                    events.publish(SpeedChange(up=False, manual=False))
                 speed_multiplier = new_speed
                 spawn_rate = min(spawn_rate * 1.02, 120)
 
         # Spawn letters
         spawn_timer += 1
         if spawn_timer >= spawn_rate:
-            letters.append(FallingLetter(speed_multiplier))
+            spawn_falling()
             spawn_timer = 0
 
         # Spawn power-ups
         powerup_spawn_timer += dt
         if powerup_spawn_timer >= 15:  # Every 15 seconds
             power_type = random.choice(["slow", "time", "freeze"])
-            power_ups.append(PowerUp(power_type))
+            powerup = PowerUp(power_type)
+            powerup.x = grid.find_spawn_x(powerup.x, powerup.y, powerup.half_width)
+            grid.insert(powerup)
+            power_ups.append(powerup)
             powerup_spawn_timer = 0
 
         # Update game objects
         for letter in letters[:]:
             letter.update(effective_dt, freeze_time > 0)
+            grid.update(letter)
             if letter.y >= DANGER_LINE_Y:
                 letters.remove(letter)
-                mistake_count += 1
-                missed_letters[letter.char] += 1
+                grid.remove(letter)
+                if word_matcher is not None:
+                    word_matcher.remove(letter)
                 combo = 0
-                screen_shake.add_trauma(0.5)
-                sound_manager.play('miss')
+                events.publish(Miss(letter.char))
 
         for powerup in power_ups[:]:
             powerup.update()
+            grid.update(powerup)
             if powerup.y > SCREEN_HEIGHT:
                 power_ups.remove(powerup)
+                grid.remove(powerup)
             # Check collision with player area (bottom of screen)
             elif powerup.y > SCREEN_HEIGHT - 100:
                 power_ups.remove(powerup)
-                sound_manager.play('powerup')
+                grid.remove(powerup)
                 if powerup.type == "slow":
                     slow_motion_time = 5.0
                 elif powerup.type == "time":
                     game_duration += 10
                 elif powerup.type == "freeze":
                     freeze_time = 3.0
+                events.publish(PowerUpCollected(powerup.type, powerup.symbol, powerup.color))
 
-                # Visual feedback
-                floating_texts.append(
-                    FloatingText(f"{powerup.symbol} Power-Up!", SCREEN_WIDTH // 2,
-                               SCREEN_HEIGHT - 150, powerup.color, font)
-                )
+        # Hand this frame's events to audio, effects, HUD and stats in one pass
+        events.drain()
+
+        if music:
+            music.set_state(speed_multiplier, combo, slow_motion_time > 0, freeze_time > 0)
+            music.update()
+
+        # Multiplayer: adopt the server's score once it has seen all our inputs
+        if race:
+            confirmed_score = race.confirmed_score()
+            if confirmed_score is not None:
+                total_score = confirmed_score
 
         for particle in particles[:]:
             particle.update(dt)
@@ -278,124 +500,209 @@ def main():
             combo_display_scale = lerp(combo_display_scale, 1.0, dt * 5)
 
         # === DRAWING ===
+        backend.begin_frame()
+        backend.offset = (0, 0)
 
         # Animated gradient background
         bg_offset = (bg_offset + dt * 10) % SCREEN_HEIGHT
-        draw_gradient_rect(screen, pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT),
-                          DARK_BG, DARK_BG2, vertical=True)
+        backend.blit(background, (0, 0))
 
         # Background particles
         for i in range(30):
             x = (i * 27 + bg_offset * 2) % SCREEN_WIDTH
             y = (i * 20 + bg_offset) % SCREEN_HEIGHT
             alpha = int(30 + 20 * math.sin(current_time + i))
-            s = pygame.Surface((6, 6), pygame.SRCALPHA)
-            pygame.draw.circle(s, (*VIBRANT_PURPLE[:3], alpha), (3, 3), 3)
-            screen.blit(s, (x, y))
+            backend.blit(dot, (int(x), int(y)), (6, 6), alpha, VIBRANT_PURPLE)
 
-        # Apply screen shake
-        shake_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        # Apply screen shake to everything from here on
+        backend.offset = (int(screen_shake.offset_x), int(screen_shake.offset_y))
 
         # Danger line with glow
-        danger_glow_size = 10
-        for i in range(danger_glow_size):
-            alpha = int(100 * (1 - i / danger_glow_size))
-            pygame.draw.line(shake_surface, (*DANGER_RED[:3], alpha),
-                           (0, DANGER_LINE_Y - i),
-                           (SCREEN_WIDTH, DANGER_LINE_Y - i), 2)
-        pygame.draw.line(shake_surface, DANGER_RED, (0, DANGER_LINE_Y),
-                        (SCREEN_WIDTH, DANGER_LINE_Y), 4)
+        backend.blit(danger_line, (0, DANGER_LINE_Y - DANGER_GLOW))
 
         # Draw game objects
-        for letter in letters:
-            letter.draw(shake_surface)
+        if word_matcher is not None:
+            highlighted = word_matcher.highlighted
+            typed_count = len(word_matcher.typed)
+            for letter in letters:
+                letter.draw(backend, typed_count if letter in highlighted else 0)
+        else:
+            for letter in letters:
+                letter.draw(backend)
 
         for powerup in power_ups:
-            powerup.draw(shake_surface, font) # Pass font to powerup
+            powerup.draw(backend, font) # Pass font to powerup
 
         for particle in particles:
-            particle.draw(shake_surface)
+            particle.draw(backend)
 
         for text in floating_texts:
-            text.draw(shake_surface)
+            text.draw(backend)
 
-        # HUD
+        # HUD (text sprites are cached, so unchanged text isn't re-rendered)
         # Score
-        score_text = font.render(f"Score: {total_score:,}", True, VIBRANT_GOLD)
-        shake_surface.blit(score_text, (10, 10))
+        backend.blit(backend.text(font, f"Score: {total_score:,}", VIBRANT_GOLD), (10, 10))
 
         # Correct/Mistakes
-        stats_text = small_font.render(f"✓ {correct_count}  ✗ {mistake_count}", True, WHITE)
-        shake_surface.blit(stats_text, (10, 50))
+        backend.blit(backend.text(small_font, f"✓ {correct_count}  ✗ {mistake_count}"), (10, 50))
 
         # Speed Indicator
-        speed_text = small_font.render(f"Speed: {speed_multiplier:.1f}x", True, VIBRANT_CYAN)
-        shake_surface.blit(speed_text, (10, 90))
+        backend.blit(backend.text(small_font, f"Speed: {speed_multiplier:.1f}x", VIBRANT_CYAN), (10, 90))
 
         # Combo meter
         if combo > 0:
-            combo_size = int(36 * combo_display_scale)
-            combo_font_dynamic = pygame.font.SysFont('Arial', combo_size, bold=True)
+            combo_text = backend.text(font, f"{combo}x COMBO!")
+            combo_size = (int(combo_text.width * combo_display_scale),
+                          int(combo_text.height * combo_display_scale))
             combo_color = VIBRANT_CYAN if combo < 10 else VIBRANT_PINK
-            draw_glow_text(shake_surface, f"{combo}x COMBO!",
-                          (SCREEN_WIDTH // 2 - 80, 10),
-                          combo_font_dynamic, combo_color, VIBRANT_PURPLE)
+            draw_glow_sprite(backend, combo_text, (SCREEN_WIDTH // 2 - 80, 10),
+                             combo_size, combo_color, VIBRANT_PURPLE)
 
         # Timer with progress bar
         time_left = game_duration - int(elapsed_time)
         progress = 1 - (elapsed_time / game_duration)
 
         # Progress bar background
-        bar_width = 200
-        bar_height = 20
         bar_x = SCREEN_WIDTH - bar_width - 10
         bar_y = 10
-
-        pygame.draw.rect(shake_surface, DARK_BG2,
-                        (bar_x, bar_y, bar_width, bar_height), border_radius=10)
+        backend.blit(bar_back, (bar_x, bar_y))
 
         # Progress bar fill with gradient
         if progress > 0:
             fill_width = int(bar_width * progress)
-            fill_rect = pygame.Rect(bar_x, bar_y, fill_width, bar_height)
             if progress > 0.5:
-                draw_gradient_rect(shake_surface, fill_rect, VIBRANT_GREEN, VIBRANT_CYAN)
+                bar_fill = bar_fills[0]
             elif progress > 0.25:
-                draw_gradient_rect(shake_surface, fill_rect, VIBRANT_GOLD, VIBRANT_GREEN)
+                bar_fill = bar_fills[1]
             else:
-                draw_gradient_rect(shake_surface, fill_rect, DANGER_RED, VIBRANT_GOLD)
+                bar_fill = bar_fills[2]
+            backend.blit(bar_fill, (bar_x, bar_y), (fill_width, bar_height))
 
         # Timer text
-        timer_text = small_font.render(f"{time_left // 60:02d}:{time_left % 60:02d}",
-                                      True, WHITE)
-        shake_surface.blit(timer_text,
-                          (bar_x + bar_width // 2 - timer_text.get_width() // 2,
-                           bar_y + 2))
+        timer_text = backend.text(small_font, f"{time_left // 60:02d}:{time_left % 60:02d}")
+        backend.blit(timer_text, (bar_x + bar_width // 2 - timer_text.width // 2, bar_y + 2))
 
         # Active power-up indicators
         powerup_y = 80
         if slow_motion_time > 0:
-            slow_text = small_font.render(f"⏱ Slow: {int(slow_motion_time)}s",
-                                         True, VIBRANT_CYAN)
-            shake_surface.blit(slow_text, (SCREEN_WIDTH - 150, powerup_y))
+            slow_text = backend.text(small_font, f"⏱ Slow: {int(slow_motion_time)}s", VIBRANT_CYAN)
+            backend.blit(slow_text, (SCREEN_WIDTH - 150, powerup_y))
             powerup_y += 30
 
         if freeze_time > 0:
-            freeze_text = small_font.render(f"❄ Freeze: {int(freeze_time)}s",
-                                          True, VIBRANT_PURPLE)
-            shake_surface.blit(freeze_text, (SCREEN_WIDTH - 150, powerup_y))
+            freeze_text = backend.text(small_font, f"❄ Freeze: {int(freeze_time)}s", VIBRANT_PURPLE)
+            backend.blit(freeze_text, (SCREEN_WIDTH - 150, powerup_y))
             powerup_y += 30
 
-        # Blit shake surface with offset
-        screen.blit(shake_surface, (int(screen_shake.offset_x), int(screen_shake.offset_y)))
-
-        pygame.display.flip()
+        # Race standings
+        if race:
+            standings_y = powerup_y + 10
+            for name, score, is_me in race.standings[:5]:
+                entry = backend.text(small_font, f"{name}: {score:,}", VIBRANT_GOLD if is_me else WHITE)
+                backend.blit(entry, (SCREEN_WIDTH - 200, standings_y))
+                standings_y += 28
+
+        # Word mode input buffer
+        if word_matcher is not None:
+            typed_text = backend.text(small_font, f"> {word_matcher.typed}_", VIBRANT_GOLD)
+            backend.blit(typed_text, (SCREEN_WIDTH // 2 - typed_text.width // 2, DANGER_LINE_Y + 20))
+
+        backend.present()
+        if capture:
+            capture.grab(screen)
+
+        # Runtime metrics: folded into aggregates here, sent from another thread
+        if metrics:
+            metrics.timing('frame_time', dt * 1000)
+            metrics.gauge('letters', len(letters))
+            metrics.gauge('particles', len(particles))
+            metrics.gauge('floating_texts', len(floating_texts))
+            metrics.gauge('speed_multiplier', speed_multiplier)
+            if correct_count + mistake_count:
+                metrics.gauge('accuracy', correct_count / (correct_count + mistake_count))
+            if music:
+                metrics.gauge('music_underruns', music.underruns)
+            metrics.tick()
+
+    if race:
+        race.close()
+    if practice:
+        practice.save()
+    if music:
+        music.stop()
+    if capture:
+        capture.close()
+        capture.report()
+    if metrics:
+        metrics.close()
+        if profile_events:
+            metrics.report()
+    if profile_events:
+        events.report()
+        if music:
+            music.report()
+
+    # Store the session; the results screen reads the updated aggregates
+    summary = None
+    if history:
+        history.record_session(player, difficulty, start_time, time.time() - start_time, total_score,
+                               correct_count, mistake_count, max_combo, letter_hits,
+                               typed_mistakes, missed_letters, keystrokes)
+        summary = history.summary(player, difficulty)
 
     # Show results
     show_results_screen(screen, clock, sound_manager, correct_count, mistake_count,
-                       typed_mistakes, missed_letters, max_combo, total_score)
+                       typed_mistakes, missed_letters, max_combo, total_score,
+                       summary, difficulty, backend.present_screen, reactions)
+    backend.close()
     pygame.quit()
 
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="DropGame - Type to Survive!")
+    parser.add_argument('--profile-startup', action='store_true',
+                        help="print a breakdown of cold start time")
+    parser.add_argument('--profile-events', action='store_true',
+                        help="print per-subscriber event and music streaming stats after the game")
+    parser.add_argument('--no-music', action='store_true',
+                        help="disable the adaptive background music")
+    parser.add_argument('--words', nargs='?', const=WORD_LIST_PATH, metavar='PATH',
+                        help="word mode: drop whole words from a word list (default: bundled list)")
+    parser.add_argument('--connect', metavar='HOST[:PORT]',
+                        help="join a multiplayer race (start one with: python multiplayer.py)")
+    parser.add_argument('--name', default=os.environ.get('USER', 'player'),
+                        help="player name shown to opponents and used for saved progress")
+    parser.add_argument('--practice', action='store_true',
+                        help="spawn more of the letters you miss (weights persist per --name)")
+    parser.add_argument('--no-history', action='store_true',
+                        help="don't record this session in the local history store")
+    parser.add_argument('--renderer', choices=BACKENDS, default='surface',
+                        help="surface blits, SDL textures (GPU if available) or SDL's software renderer")
+    parser.add_argument('--statsd', nargs='?', const='127.0.0.1', metavar='HOST[:PORT]',
+                        help=f"send runtime metrics to a StatsD server (default 127.0.0.1:{STATSD_PORT})")
+    parser.add_argument('--capture', metavar='DIR',
+                        help="record gameplay frames into DIR")
+    parser.add_argument('--capture-format', choices=['auto', 'ffmpeg', 'png', 'raw'], default='auto',
+                        help="ffmpeg (mp4), png or raw frame sequence; auto uses ffmpeg when installed")
+    return parser.parse_args()
+
+
 if __name__ == '__main__':
-    main()
+    args = parse_args()
+    word_list = load_word_list(args.words) if args.words else None
+    race = None
+    if args.connect:
+        host, _, port = args.connect.partition(':')
+        race = RaceClient(host, int(port or RACE_PORT), args.name)
+        race.start()
+    practice = PracticeProfile(args.name) if args.practice else None
+    metrics = None
+    if args.statsd:
+        host, _, port = args.statsd.partition(':')
+        metrics = MetricsExporter(host, int(port or STATSD_PORT))
+        metrics.start()
+    main(profile_startup=args.profile_startup, word_list=word_list, race=race,
+         profile_events=args.profile_events, play_music=not args.no_music, practice=practice,
+         capture_dir=args.capture, capture_format=args.capture_format,
+         history=None if args.no_history else open_history(), player=args.name,
+         renderer=args.renderer, metrics=metrics)
@@ -0,0 +1,251 @@
+import argparse
+import queue
+import socket
+import threading
+import time
+from config import STATSD_PORT
+
+FLUSH_INTERVAL = 1.0   # seconds of samples per batch
+QUEUE_BATCHES = 8      # batches waiting for the sender before new ones are dropped
+MAX_DATAGRAM = 1432    # fits in one Ethernet frame with IP/UDP headers
+
+
+class _Timer:
+    __slots__ = ('count', 'total', 'max')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+
+class MetricsExporter:
+    """Ships runtime metrics to a StatsD-compatible endpoint over UDP.
+
+    The game loop only folds samples into in-memory aggregates (counters,
+    last-value gauges, timers as count/sum/max). Once per FLUSH_INTERVAL
+    tick() swaps the aggregates out and hands them to a sender thread as one
+    batch through a bounded queue. If the sender falls behind, whole batches
+    are dropped and counted rather than waited for, so nothing on the frame
+    path ever blocks on the network.
+    """
+
+    def __init__(self, host='127.0.0.1', port=STATSD_PORT, prefix='dropgame',
+                 interval=FLUSH_INTERVAL, queue_size=QUEUE_BATCHES):
+        self.address = (host, port)
+        self.prefix = prefix
+        self.interval = interval
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.thread = threading.Thread(target=self._worker, daemon=True)
+        self._reset(time.perf_counter())
+
+        # Counters
+        self.batches = 0
+        self.dropped_batches = 0
+        self.packets_sent = 0
+        self.send_errors = 0
+
+    def _reset(self, now):
+        self.counters = {}
+        self.gauges = {}
+        self.timers = {}
+        self.window_start = now
+
+    def incr(self, name, count=1):
+        self.counters[name] = self.counters.get(name, 0) + count
+
+    def gauge(self, name, value):
+        self.gauges[name] = value
+
+    def timing(self, name, ms):
+        timer = self.timers.get(name)
+        if timer is None:
+            timer = self.timers[name] = _Timer()
+        timer.count += 1
+        timer.total += ms
+        if ms > timer.max:
+            timer.max = ms
+
+    def tick(self, now=None):
+        """Call once per frame; hands a batch to the sender every interval"""
+        now = time.perf_counter() if now is None else now
+        if now - self.window_start >= self.interval:
+            self.flush(now)
+
+    def flush(self, now=None):
+        now = time.perf_counter() if now is None else now
+        batch = (now - self.window_start, self.counters, self.gauges, self.timers)
+        self._reset(now)
+        try:
+            self.queue.put_nowait(batch)
+            self.batches += 1
+        except queue.Full:
+            self.dropped_batches += 1
+
+    def start(self):
+        self.thread.start()
+
+    def close(self, timeout=1.0):
+        """Send what has been collected so far and stop the sender"""
+        self.flush()
+        if not self.thread.is_alive():
+            return
+        try:
+            self.queue.put(None, timeout=timeout)
+        except queue.Full:
+            return
+        self.thread.join(timeout)
+
+    def format(self, batch):
+        """StatsD lines for one batch"""
+        seconds, counters, gauges, timers = batch
+        p = self.prefix
+        lines = []
+        for name, count in counters.items():
+            lines.append(f"{p}.{name}:{count}|c")
+            lines.append(f"{p}.{name}_per_second:{count / max(seconds, 1e-9):.2f}|g")
+        for name, value in gauges.items():
+            lines.append(f"{p}.{name}:{value:.4g}|g")
+        for name, timer in timers.items():
+            lines.append(f"{p}.{name}.mean:{timer.total / timer.count:.3f}|g")
+            lines.append(f"{p}.{name}.max:{timer.max:.3f}|g")
+            lines.append(f"{p}.{name}.count:{timer.count}|c")
+        return lines
+
+    @staticmethod
+    def packets(lines):
+        """Join lines into newline-separated datagrams of at most MAX_DATAGRAM bytes"""
+        packet = b''
+        for line in lines:
+            data = line.encode()
+            if packet and len(packet) + 1 + len(data) > MAX_DATAGRAM:
+                yield packet
+                packet = b''
+            packet = packet + b'\n' + data if packet else data
+        if packet:
+            yield packet
+
+    def _worker(self):
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        address = self.address
+        try:
+            # Resolve once, here rather than on the game thread
+            address = (socket.gethostbyname(address[0]), address[1])
+        except OSError:
+            print(f"Could not resolve StatsD host {address[0]}")
+        try:
+            while True:
+                batch = self.queue.get()
+                if batch is None:
+                    break
+                for packet in self.packets(self.format(batch)):
+                    try:
+                        sock.sendto(packet, address)
+                        self.packets_sent += 1
+                    except OSError:
+                        self.send_errors += 1
+        finally:
+            sock.close()
+
+    def report(self):
+        print(f"Metrics ({self.address[0]}:{self.address[1]}):")
+        print(f"  batches {self.batches}, dropped {self.dropped_batches}, "
+              f"packets sent {self.packets_sent}, send errors {self.send_errors}")
+
+
+# Local stand-ins for a StatsD server
+
+def listen(port=STATSD_PORT, host='127.0.0.1'):
+    """Print every line received, like a StatsD server with a debug log"""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.bind((host, port))
+    print(f"Listening for StatsD on {host}:{port}")
+    while True:
+        data, _ = sock.recvfrom(65535)
+        for line in data.decode(errors='replace').splitlines():
+            print(line)
+
+
+def self_check(frames=300):
+    """Run a fake 60 fps loop against a local UDP listener and verify what arrives.
+
+    Also checks that a stalled sender drops batches instead of blocking.
+    Returns a list of failures.
+    """
+    failures = []
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.bind(('127.0.0.1', 0))
+    sock.settimeout(0.5)
+    port = sock.getsockname()[1]
+
+    exporter = MetricsExporter('127.0.0.1', port, interval=1.0)
+    exporter.start()
+    worst = 0.0
+    clock = exporter.window_start
+    for frame in range(frames):
+        clock += 1 / 60
+        start = time.perf_counter()
+        exporter.timing('frame_time', 16.0 + frame % 3)
+        exporter.gauge('letters', frame % 12)
+        exporter.gauge('speed_multiplier', 1.3)
+        exporter.incr('keys', 2)
+        exporter.tick(clock)
+        worst = max(worst, time.perf_counter() - start)
+    exporter.close()
+
+    received = {}
+    try:
+        while True:
+            data, _ = sock.recvfrom(65535)
+            for line in data.decode().splitlines():
+                name, _, value = line.partition(':')
+                received.setdefault(name, []).append(value)
+    except socket.timeout:
+        pass
+    sock.close()
+
+    keys = sum(int(v.split('|')[0]) for v in received.get('dropgame.keys', []))
+    frames_seen = sum(int(v.split('|')[0]) for v in received.get('dropgame.frame_time.count', []))
+    print(f"Self-check: {exporter.batches} batches, {exporter.packets_sent} packets, "
+          f"worst per-frame cost {worst * 1e6:.0f} us")
+    if keys != frames * 2:
+        failures.append(f"keys counter {keys}, expected {frames * 2}")
+    if frames_seen != frames:
+        failures.append(f"frame_time count {frames_seen}, expected {frames}")
+    if received.get('dropgame.speed_multiplier', [''])[-1] != '1.3|g':
+        failures.append(f"speed gauge {received.get('dropgame.speed_multiplier')}")
+    rate = float(received.get('dropgame.keys_per_second', ['0|g'])[0].split('|')[0])
+    if abs(rate - 120) > 2:
+        failures.append(f"keys rate {rate}, expected 120")
+
+    # Sender never started: the queue fills and further batches are dropped
+    stalled = MetricsExporter('127.0.0.1', port, interval=1.0, queue_size=2)
+    start = time.perf_counter()
+    for _ in range(10):
+        stalled.incr('keys')
+        stalled.tick(stalled.window_start + 1.0)
+    elapsed = time.perf_counter() - start
+    print(f"Stalled sender: {stalled.batches} queued, {stalled.dropped_batches} dropped in {elapsed * 1e6:.0f} us")
+    if stalled.batches != 2 or stalled.dropped_batches != 8:
+        failures.append("bounded queue did not drop on overflow")
+
+    for failure in failures:
+        print(f"  FAIL {failure}")
+    if not failures:
+        print("  ok")
+    return failures
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="StatsD metrics exporter tools")
+    parser.add_argument('--listen', nargs='?', type=int, const=STATSD_PORT, metavar='PORT',
+                        help="print StatsD lines received on PORT")
+    parser.add_argument('--self-check', action='store_true',
+                        help="send a scripted session to a local listener and verify it")
+    args = parser.parse_args()
+    if args.listen:
+        listen(args.listen)
+    elif args.self_check:
+        raise SystemExit(1 if self_check() else 0)
+    else:
+        parser.print_help()
@@ -0,0 +1,394 @@
+import argparse
+import asyncio
+import json
+import multiprocessing
+import queue
+import random
+import statistics
+import threading
+import time
+
+from config import RACE_PORT, RACE_TICK_RATE
+from utils import hit_points
+from words import MAX_WORD_LENGTH
+
+# Protocol: newline-delimited compact JSON over TCP.
+#
+# client -> server
+#   {"t": "hello", "n": name}
+#   {"t": "hit" | "miss" | "mistake", "c": text, "q": seq}
+# server -> client
+#   {"t": "welcome", "id": pid, "seed": seed, "tick": rate}
+#   {"t": "s", "k": tick, "p": {pid: {"n": name, "s": score, "c": combo}}, "g": [pid]}
+#       Shared state delta. Only fields that changed since the previous tick
+#       are present; "g" lists players that left. The same bytes go to everyone.
+#   {"t": "a", "a": seq, "b": [[from_name, count], ...]}
+#       Personal: last input seq the server applied, plus bursts to spawn.
+
+BURST_COMBO = 5
+BURST_SIZE = 3
+MAX_SEND_BUFFER = 256 * 1024  # drop clients that stop reading
+
+
+def encode(msg):
+    return (json.dumps(msg, separators=(',', ':')) + '\n').encode()
+
+
+class _Player:
+    def __init__(self, pid, name, writer):
+        self.id = pid
+        self.name = name
+        self.writer = writer
+        self.score = 0
+        self.combo = 0
+        self.ack = 0
+        self.ack_sent = 0
+        self.sent = None  # (name, score, combo) as of the last broadcast
+        self.bursts = []
+
+
+class RaceServer:
+    """Authoritative race server: owns the spawn seed, scores and bursts"""
+
+    def __init__(self, host='0.0.0.0', port=RACE_PORT, tick_rate=RACE_TICK_RATE, seed=None):
+        self.host = host
+        self.port = port
+        self.tick_rate = tick_rate
+        self.seed = seed if seed is not None else random.randrange(2 ** 31)
+        self.players = {}
+        self.dirty = set()
+        self.departed = []
+        self.next_id = 1
+        self.tick = 0
+        self.overruns = 0
+        self.dropped = 0
+
+    async def serve(self):
+        server = await asyncio.start_server(self._handle, self.host, self.port)
+        async with server:
+            await self._tick_loop()
+
+    async def _handle(self, reader, writer):
+        try:
+            hello = json.loads(await reader.readline())
+        except ValueError:
+            hello = None
+        if not isinstance(hello, dict):
+            writer.close()
+            return
+
+        pid = str(self.next_id)
+        self.next_id += 1
+        player = _Player(pid, str(hello.get('n', f'player{pid}'))[:16], writer)
+
+        # Full snapshot of everyone as of the last broadcast; later deltas apply on top
+        snapshot = {p.id: dict(zip('nsc', p.sent)) for p in self.players.values() if p.sent}
+        writer.write(encode({'t': 'welcome', 'id': pid, 'seed': self.seed, 'tick': self.tick_rate}))
+        writer.write(encode({'t': 's', 'k': self.tick, 'p': snapshot}))
+        self.players[pid] = player
+        self.dirty.add(pid)
+
+        try:
+            async for line in reader:
+                self._apply(player, json.loads(line))
+        except (ConnectionError, ValueError):
+            pass
+        finally:
+            if self.players.pop(pid, None) is not None and player.sent:
+                self.departed.append(pid)
+            self.dirty.discard(pid)
+            writer.close()
+
+    def _apply(self, player, msg):
+        if not isinstance(msg, dict):
+            raise ValueError("input is not an object")
+        kind = msg.get('t')
+        if kind == 'hit':
+            player.combo += 1
+            # Scores are ours to decide: no hit is worth more than the longest word
+            text = msg.get('c')
+            length = min(len(text), MAX_WORD_LENGTH) if isinstance(text, str) and text else 1
+            player.score += hit_points(player.combo, length)
+            if player.combo % BURST_COMBO == 0:
+                for other in self.players.values():
+                    if other is not player:
+                        other.bursts.append([player.name, BURST_SIZE])
+        elif kind in ('miss', 'mistake'):
+            player.combo = 0
+        player.ack = msg.get('q', player.ack)
+        self.dirty.add(player.id)
+
+    async def _tick_loop(self):
+        loop = asyncio.get_running_loop()
+        interval = 1.0 / self.tick_rate
+        next_tick = loop.time()
+        while True:
+            next_tick += interval
+            self._broadcast()
+            delay = next_tick - loop.time()
+            if delay < 0:
+                # Fell behind; skip ahead rather than bursting ticks to catch up
+                self.overruns += 1
+                next_tick = loop.time()
+            else:
+                await asyncio.sleep(delay)
+
+    def _broadcast(self):
+        self.tick += 1
+
+        # Shared delta: changed fields of changed players, encoded once
+        changed = {}
+        for pid in self.dirty:
+            player = self.players.get(pid)
+            if player is None:
+                continue
+            state = (player.name, player.score, player.combo)
+            old = player.sent or (None, None, None)
+            fields = {k: v for k, v, o in zip('nsc', state, old) if v != o}
+            if fields:
+                changed[pid] = fields
+            player.sent = state
+        self.dirty.clear()
+
+        shared = None
+        if changed or self.departed:
+            msg = {'t': 's', 'k': self.tick, 'p': changed}
+            if self.departed:
+                msg['g'] = self.departed
+                self.departed = []
+            shared = encode(msg)
+
+        for player in list(self.players.values()):
+            writer = player.writer
+            if writer.transport.get_write_buffer_size() > MAX_SEND_BUFFER:
+                # Forget the player now; its reader task may take a while to end
+                self.dropped += 1
+                del self.players[player.id]
+                if player.sent:
+                    self.departed.append(player.id)
+                writer.close()
+                continue
+            if shared:
+                writer.write(shared)
+            if player.ack != player.ack_sent or player.bursts:
+                personal = {'t': 'a', 'a': player.ack}
+                if player.bursts:
+                    personal['b'] = player.bursts
+                    player.bursts = []
+                writer.write(encode(personal))
+                player.ack_sent = player.ack
+
+
+class RaceClient:
+    """Talks to a RaceServer from a background thread.
+
+    The game loop never waits on the network: inputs are handed to the
+    asyncio thread with call_soon_threadsafe and server updates are read
+    with non-blocking polls. The local game predicts its own score and
+    adopts the server's value once every sent input has been acknowledged.
+    """
+
+    def __init__(self, host, port=RACE_PORT, name='player'):
+        self.host = host
+        self.port = port
+        self.name = name
+        self.id = None
+        self.seed = None
+        self.connected = False
+        self.seq = 0
+        self.ack = 0
+        self.standings = []
+        self._players = {}
+        self._bursts = queue.SimpleQueue()
+        self._ready = threading.Event()
+        self._loop = None
+        self._writer = None
+
+    def start(self):
+        threading.Thread(target=lambda: asyncio.run(self._run()), daemon=True).start()
+
+    def wait_until_ready(self, timeout=5.0):
+        """Block until the server sent its welcome (call before the game loop)"""
+        self._ready.wait(timeout)
+        return self.connected
+
+    async def _run(self):
+        self._loop = asyncio.get_running_loop()
+        try:
+            reader, self._writer = await asyncio.open_connection(self.host, self.port)
+        except OSError as e:
+            print(f"Could not connect to race server: {e}")
+            self._ready.set()
+            return
+
+        self._writer.write(encode({'t': 'hello', 'n': self.name}))
+        try:
+            async for line in reader:
+                self._receive(json.loads(line))
+        except (ConnectionError, ValueError):
+            pass
+        self.connected = False
+        self._ready.set()
+
+    def _receive(self, msg):
+        kind = msg.get('t')
+        if kind == 's':
+            for pid, fields in msg.get('p', {}).items():
+                self._players.setdefault(pid, {}).update(fields)
+            for pid in msg.get('g', ()):
+                self._players.pop(pid, None)
+            # Publish a fresh list so the game thread never sees a half-applied update
+            self.standings = sorted(((p.get('n', '?'), p.get('s', 0), pid == self.id)
+                                     for pid, p in self._players.items()),
+                                    key=lambda entry: -entry[1])
+        elif kind == 'a':
+            self.ack = msg['a']
+            for burst in msg.get('b', ()):
+                self._bursts.put(tuple(burst))
+        elif kind == 'welcome':
+            self.id = msg['id']
+            self.seed = msg['seed']
+            self.connected = True
+            self._ready.set()
+
+    def send(self, kind, text):
+        """Report a hit/miss/mistake; never blocks"""
+        if not self.connected:
+            return
+        self.seq += 1
+        data = encode({'t': kind, 'c': text, 'q': self.seq})
+        try:
+            self._loop.call_soon_threadsafe(self._writer.write, data)
+        except RuntimeError:
+            # The network thread already shut down
+            self.connected = False
+
+    def poll_bursts(self):
+        """Bursts (from_name, count) received since the last poll"""
+        bursts = []
+        while True:
+            try:
+                bursts.append(self._bursts.get_nowait())
+            except queue.Empty:
+                return bursts
+
+    def confirmed_score(self):
+        """The server's score for us, or None while inputs are still in flight"""
+        if self.ack != self.seq:
+            return None
+        player = self._players.get(self.id)
+        return player.get('s') if player else None
+
+    def close(self):
+        if self._loop and self._writer:
+            self._loop.call_soon_threadsafe(self._writer.close)
+
+
+def run_server(host='0.0.0.0', port=RACE_PORT, tick_rate=RACE_TICK_RATE, seed=None):
+    server = RaceServer(host, port, tick_rate, seed)
+    print(f"Race server on {host}:{port} (seed {server.seed}, {tick_rate} ticks/s)")
+    try:
+        asyncio.run(server.serve())
+    except KeyboardInterrupt:
+        pass
+
+
+# Load test: one server process, many simulated clients on localhost
+
+async def _simulated_client(index, host, port, duration, stats):
+    for _ in range(50):
+        try:
+            reader, writer = await asyncio.open_connection(host, port)
+            break
+        except OSError:
+            await asyncio.sleep(0.1)
+    else:
+        stats['failed'] += 1
+        return
+
+    writer.write(encode({'t': 'hello', 'n': f'bot{index}'}))
+    sent_at = {}
+    seq = 0
+    last_state = None
+
+    async def receive():
+        nonlocal last_state
+        async for line in reader:
+            now = time.perf_counter()
+            stats['bytes'] += len(line)
+            msg = json.loads(line)
+            if msg['t'] == 's':
+                if last_state is not None:
+                    stats['gaps'].append(now - last_state)
+                last_state = now
+            elif msg['t'] == 'a':
+                for q in [q for q in sent_at if q <= msg['a']]:
+                    stats['rtt'].append(now - sent_at.pop(q))
+                stats['bursts'] += len(msg.get('b', ()))
+
+    receiver = asyncio.create_task(receive())
+    end = time.perf_counter() + duration
+    rng = random.Random(index)
+    while time.perf_counter() < end:
+        # Roughly a fast typist: ~6 inputs a second, one in ten a mistake
+        await asyncio.sleep(rng.expovariate(6.0))
+        seq += 1
+        kind = 'mistake' if rng.random() < 0.1 else 'hit'
+        sent_at[seq] = time.perf_counter()
+        writer.write(encode({'t': kind, 'c': rng.choice('ABCDEFGHIJKLMNOPQRSTUVWXYZ'), 'q': seq}))
+        stats['sent'] += 1
+
+    receiver.cancel()
+    writer.close()
+
+
+async def _load_test(host, port, clients, duration):
+    stats = {'sent': 0, 'bytes': 0, 'bursts': 0, 'failed': 0, 'rtt': [], 'gaps': []}
+    await asyncio.gather(*(_simulated_client(i, host, port, duration, stats)
+                           for i in range(clients)))
+    return stats
+
+
+def load_test(clients=120, duration=10.0, port=RACE_PORT + 1, tick_rate=RACE_TICK_RATE):
+    """Run `clients` simulated players against a server in a separate process"""
+    server = multiprocessing.Process(target=run_server, args=('127.0.0.1', port, tick_rate, 1234),
+                                     daemon=True)
+    server.start()
+    try:
+        stats = asyncio.run(_load_test('127.0.0.1', port, clients, duration))
+    finally:
+        server.terminate()
+        server.join()
+
+    rtt = sorted(stats['rtt']) or [0.0]
+    gaps = stats['gaps'] or [0.0]
+    connected = clients - stats['failed']
+    print(f"clients: {connected}/{clients} connected, {stats['sent']} inputs sent")
+    print(f"input ack latency: p50 {rtt[len(rtt) // 2] * 1000:.1f} ms, "
+          f"p99 {rtt[int(len(rtt) * 0.99)] * 1000:.1f} ms, max {rtt[-1] * 1000:.1f} ms")
+    print(f"state updates: mean gap {statistics.mean(gaps) * 1000:.1f} ms "
+          f"(tick {1000 / tick_rate:.1f} ms), max gap {max(gaps) * 1000:.1f} ms")
+    print(f"downstream: {stats['bytes'] / max(connected, 1) / duration / 1024:.1f} KiB/s per client, "
+          f"{stats['bursts']} bursts delivered")
+    return stats
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="DropGame race server")
+    parser.add_argument('--host', default='0.0.0.0')
+    parser.add_argument('--port', type=int, default=RACE_PORT)
+    parser.add_argument('--tick-rate', type=int, default=RACE_TICK_RATE)
+    parser.add_argument('--seed', type=int)
+    parser.add_argument('--load-test', type=int, metavar='CLIENTS',
+                        help="run CLIENTS simulated players against a local server and report")
+    parser.add_argument('--duration', type=float, default=10.0,
+                        help="load test length in seconds")
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    if args.load_test:
+        load_test(args.load_test, args.duration, args.port, args.tick_rate)
+    else:
+        run_server(args.host, args.port, args.tick_rate, args.seed)
@@ -0,0 +1,192 @@
+import queue
+import threading
+import time
+import pygame
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+SAMPLE_RATE = 44100
+BEATS_PER_CHUNK = 1
+QUEUE_CHUNKS = 1  # rendered ahead of the one playing and the one in Channel.queue
+
+# A minor / F / C / G, one chord per bar (root, third, fifth in Hz)
+PROGRESSION = [
+    (110.00, 130.81, 164.81),
+    (87.31, 110.00, 130.81),
+    (130.81, 164.81, 196.00),
+    (98.00, 123.47, 146.83),
+]
+
+
+class MusicStreamer:
+    """Adaptive background music synthesized on a worker thread.
+
+    The worker renders short chunks (BEATS_PER_CHUNK beats) with NumPy into a
+    small queue. The game loop calls update() once per frame, which only hands
+    ready chunks to a reserved mixer channel via Channel.queue and never waits
+    on synthesis. Tempo and layers follow the values passed to set_state().
+
+    The worker only starts a chunk once a queue slot is free, so it reads the
+    state as late as possible and changes are heard within about two beats.
+    """
+
+    def __init__(self):
+        self.enabled = np is not None
+        if not self.enabled:
+            print("NumPy not installed, music disabled")
+            return
+
+        pygame.mixer.set_reserved(1)
+        self.channel = pygame.mixer.Channel(0)
+        self.chunks = queue.Queue(maxsize=QUEUE_CHUNKS)
+        self.slots = threading.Semaphore(QUEUE_CHUNKS)
+        self.state = (1.0, 0, False, False)
+        self.running = False
+        self.thread = None
+        self.sample_pos = 0
+        self.beat = 0
+        self.started = False
+        self.starved = False
+
+        # Metrics
+        self.underruns = 0
+        self.chunks_played = 0
+        self.chunks_synthesized = 0
+        self.synth_seconds = 0.0
+        self.synth_worst = 0.0
+        self.audio_seconds = 0.0
+
+    def start(self):
+        if not self.enabled:
+            return
+        self.running = True
+        self.thread = threading.Thread(target=self._worker, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        if not self.enabled:
+            return
+        self.running = False
+        self.channel.stop()
+        if self.thread:
+            self.thread.join(timeout=1.0)
+
+    def set_state(self, speed_multiplier, combo, slow_motion=False, frozen=False):
+        # A single tuple assignment, so the worker never sees a torn update
+        self.state = (speed_multiplier, combo, slow_motion, frozen)
+
+    def update(self):
+        """Feed the mixer channel; call once per frame"""
+        if not self.enabled:
+            return
+
+        if self.started and not self.channel.get_busy():
+            if not self.starved:
+                # The channel ran dry before the next chunk was ready
+                self.underruns += 1
+                self.starved = True
+
+        if self.channel.get_queue() is not None:
+            return
+        try:
+            sound = self.chunks.get_nowait()
+        except queue.Empty:
+            return
+        self.slots.release()
+
+        if self.channel.get_busy():
+            self.channel.queue(sound)
+        else:
+            self.channel.play(sound)
+        self.started = True
+        self.starved = False
+        self.chunks_played += 1
+
+    def _worker(self):
+        while self.running:
+            # Wait for room before rendering, so no chunk sits in the queue
+            # built from state that has since changed
+            if not self.slots.acquire(timeout=0.1):
+                continue
+            start = time.perf_counter()
+            samples = self._render_chunk(*self.state)
+            sound = pygame.mixer.Sound(buffer=samples.tobytes())
+            elapsed = time.perf_counter() - start
+            self.chunks_synthesized += 1
+            self.synth_seconds += elapsed
+            self.synth_worst = max(self.synth_worst, elapsed)
+            self.audio_seconds += len(samples) / SAMPLE_RATE
+            self.chunks.put_nowait(sound)
+
+    def _render_chunk(self, speed_multiplier, combo, slow_motion, frozen):
+        bpm = min(180.0, max(70.0, 80.0 + 40.0 * speed_multiplier))
+        pitch = 1.0
+        if slow_motion:
+            bpm *= 0.6
+            pitch = 0.75
+        beat_len = int(SAMPLE_RATE * 60.0 / bpm)
+        n = beat_len * BEATS_PER_CHUNK
+
+        # Absolute time keeps the sustained pad phase-continuous across chunks
+        t = (self.sample_pos + np.arange(n)) / SAMPLE_RATE
+        local = np.arange(beat_len) / SAMPLE_RATE
+        out = np.zeros(n)
+
+        for b in range(BEATS_PER_CHUNK):
+            beat = self.beat + b
+            chord = [f * pitch for f in PROGRESSION[(beat // 4) % len(PROGRESSION)]]
+            seg = slice(b * beat_len, (b + 1) * beat_len)
+            ts = t[seg]
+
+            # Pad: always on, softer while frozen
+            pad = sum(np.sin(2 * np.pi * f * 2 * ts) for f in chord) / 3
+            out[seg] += pad * (0.10 if frozen else 0.16)
+            if frozen:
+                continue
+
+            # Bass on every beat with a plucked envelope
+            out[seg] += 0.35 * np.sin(2 * np.pi * chord[0] * local) * np.exp(-local * 6)
+
+            # Arpeggio once a combo gets going
+            if combo >= 5:
+                step = beat_len // 4
+                for i in range(4):
+                    f = chord[i % 3] * 4
+                    span = local[:step]
+                    start = b * beat_len + i * step
+                    out[start:start + step] += 0.10 * np.sign(np.sin(2 * np.pi * f * span)) * np.exp(-span * 20)
+
+            # Off-beat hi-hat for long combos
+            if combo >= 10:
+                half = beat_len // 2
+                hat_len = min(2000, beat_len - half)
+                noise = np.random.uniform(-1, 1, hat_len)
+                out[b * beat_len + half:b * beat_len + half + hat_len] += \
+                    0.08 * noise * np.exp(-np.arange(hat_len) / 300)
+
+        self.sample_pos += n
+        self.beat += BEATS_PER_CHUNK
+
+        mono = (np.clip(out, -1.0, 1.0) * 0.5 * 32767).astype(np.int16)
+        return np.repeat(mono[:, None], 2, axis=1)
+
+    def metrics(self):
+        return {
+            'underruns': self.underruns,
+            'chunks_played': self.chunks_played,
+            'synth_ms_mean': self.synth_seconds / max(self.chunks_synthesized, 1) * 1000,
+            'synth_ms_max': self.synth_worst * 1000,
+            'realtime_ratio': self.synth_seconds / max(self.audio_seconds, 1e-9),
+        }
+
+    def report(self):
+        if not self.enabled:
+            return
+        m = self.metrics()
+        print("Music streamer:")
+        print(f"  chunks played {m['chunks_played']}, underruns {m['underruns']}")
+        print(f"  synthesis per chunk: mean {m['synth_ms_mean']:.2f} ms, max {m['synth_ms_max']:.2f} ms "
+              f"({m['realtime_ratio'] * 100:.1f}% of real time)")
@@ -0,0 +1,121 @@
+import json
+import os
+import random
+import re
+from config import DATA_DIR
+
+ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+# Older results fade so the weights track how the player types *now*
+DECAY = 0.97
+# Floor so letters the player has mastered still show up now and then
+BASE_WEIGHT = 0.05
+
+
+class WeightedSampler:
+    """Sample indices in proportion to weights that change all the time.
+
+    A Fenwick (binary indexed) tree over the weights gives O(log n) updates
+    and O(log n) sampling, so weights can be adjusted on every keystroke
+    without rebuilding anything.
+    """
+
+    def __init__(self, weights):
+        self.n = len(weights)
+        self.weights = [0.0] * self.n
+        self.tree = [0.0] * (self.n + 1)
+        self.updates = 0
+        for i, w in enumerate(weights):
+            self.set(i, w)
+
+    def set(self, i, weight):
+        delta = weight - self.weights[i]
+        self.weights[i] = weight
+        j = i + 1
+        while j <= self.n:
+            self.tree[j] += delta
+            j += j & -j
+        self.updates += 1
+        if self.updates % 10000 == 0:
+            self._rebuild()
+
+    def _rebuild(self):
+        # Float deltas drift after many updates; rebuild from the exact weights
+        self.tree = [0.0] * (self.n + 1)
+        for i, w in enumerate(self.weights):
+            j = i + 1
+            self.tree[j] += w
+            parent = j + (j & -j)
+            if parent <= self.n:
+                self.tree[parent] += self.tree[j]
+
+    def total(self):
+        total = 0.0
+        j = self.n
+        while j > 0:
+            total += self.tree[j]
+            j -= j & -j
+        return total
+
+    def sample(self, rng=random):
+        target = rng.random() * self.total()
+        pos = 0
+        step = 1 << self.n.bit_length()
+        while step:
+            nxt = pos + step
+            if nxt <= self.n and self.tree[nxt] <= target:
+                pos = nxt
+                target -= self.tree[nxt]
+            step >>= 1
+        return min(pos, self.n - 1)
+
+
+class PracticeProfile:
+    """Per-player letter weakness, persisted between sessions"""
+
+    def __init__(self, player):
+        self.player = player
+        self.path = os.path.join(DATA_DIR, 'practice',
+                                 re.sub(r'[^A-Za-z0-9_-]', '_', player) + '.json')
+        self.attempts = {c: 0.0 for c in ALPHABET}
+        self.errors = {c: 0.0 for c in ALPHABET}
+        self.load()
+        self.sampler = WeightedSampler([self.weight(c) for c in ALPHABET])
+
+    def weight(self, char):
+        # Smoothed error rate: unseen letters start at 0.5
+        return BASE_WEIGHT + (self.errors[char] + 1) / (self.attempts[char] + 2)
+
+    def record(self, char, correct):
+        """Fold one hit or miss into the letter's weight; O(log 26)"""
+        if char not in self.attempts:
+            return
+        self.attempts[char] = self.attempts[char] * DECAY + 1
+        self.errors[char] = self.errors[char] * DECAY + (0 if correct else 1)
+        self.sampler.set(ALPHABET.index(char), self.weight(char))
+
+    def sample(self, rng=random):
+        return ALPHABET[self.sampler.sample(rng)]
+
+    def weakest(self, count=3):
+        return sorted(ALPHABET, key=self.weight, reverse=True)[:count]
+
+    def load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        for char, (attempts, errors) in data.get('letters', {}).items():
+            if char in self.attempts:
+                self.attempts[char] = float(attempts)
+                self.errors[char] = float(errors)
+
+    def save(self):
+        data = {'letters': {c: [round(self.attempts[c], 4), round(self.errors[c], 4)] for c in ALPHABET}}
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+        except OSError:
+            print(f"Could not save practice profile for {self.player}")
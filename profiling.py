@@ -0,0 +1,25 @@
+import time
+
+
+class StartupProfiler:
+    """Records how long each startup phase took and prints a breakdown"""
+
+    def __init__(self, start=None):
+        self.start = start if start is not None else time.perf_counter()
+        self.last = self.start
+        self.phases = []
+
+    def mark(self, phase):
+        """Close the current phase, naming it `phase`"""
+        now = time.perf_counter()
+        self.phases.append((phase, now - self.last))
+        self.last = now
+
+    def total(self):
+        return self.last - self.start
+
+    def report(self):
+        print("Startup profile:")
+        for phase, seconds in self.phases:
+            print(f"  {phase:<12} {seconds * 1000:8.1f} ms")
+        print(f"  {'total':<12} {self.total() * 1000:8.1f} ms")
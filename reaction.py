@@ -0,0 +1,134 @@
+import argparse
+import math
+import random
+import time
+
+RELATIVE_ACCURACY = 0.02   # quantiles come back within 2% of the true value
+MAX_BUCKETS = 128          # per sketch; 0.1 s to 20 s needs about 135 at 2%
+
+
+class QuantileSketch:
+    """Streaming quantiles in fixed memory (DDSketch).
+
+    Each value is counted in a logarithmic bucket: bucket i holds values in
+    (gamma^(i-1), gamma^i] with gamma = (1 + a) / (1 - a), so any quantile
+    read back is within relative accuracy a of the true one. No samples are
+    kept. If more than max_buckets are ever needed the two lowest buckets
+    are merged, which only blurs the fastest values, never p50/p90.
+    """
+
+    def __init__(self, accuracy=RELATIVE_ACCURACY, max_buckets=MAX_BUCKETS, min_value=1e-6):
+        self.gamma = (1 + accuracy) / (1 - accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.max_buckets = max_buckets
+        self.min_value = min_value
+        self.buckets = {}  # bucket index -> count
+        self.zeros = 0     # values at or below min_value
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def add(self, value):
+        self.count += 1
+        if value <= self.min_value:
+            self.zeros += 1
+            return
+        index = math.ceil(math.log(value) / self.log_gamma)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        if len(self.buckets) > self.max_buckets:
+            self._collapse()
+
+    def _collapse(self):
+        lowest, second = sorted(self.buckets)[:2]
+        self.buckets[second] += self.buckets.pop(lowest)
+
+    def merge(self, other):
+        """Fold another sketch with the same accuracy into this one"""
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        self.zeros += other.zeros
+        self.count += other.count
+        while len(self.buckets) > self.max_buckets:
+            self._collapse()
+
+    def quantile(self, q):
+        """Value at quantile q (0..1), or None when empty"""
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        seen = self.zeros
+        if rank < seen:
+            return 0.0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if rank < seen:
+                # Midpoint of the bucket in relative terms
+                return 2 * self.gamma ** index / (self.gamma + 1)
+        return 2 * self.gamma ** max(self.buckets) / (self.gamma + 1)
+
+
+class ReactionStats:
+    """Per-letter reaction time and distance left to the danger line.
+
+    One pair of QuantileSketches per letter, so memory stays the same
+    however long the session runs.
+    """
+
+    def __init__(self):
+        self.times = {}
+        self.distances = {}
+
+    def record(self, char, seconds, distance):
+        if char not in self.times:
+            self.times[char] = QuantileSketch()
+            self.distances[char] = QuantileSketch()
+        self.times[char].add(seconds)
+        self.distances[char].add(max(distance, 0))
+
+    def letter(self, char):
+        """(hits, p50 seconds, p90 seconds, p50 distance) for one letter"""
+        times = self.times[char]
+        return (len(times), times.quantile(0.5), times.quantile(0.9),
+                self.distances[char].quantile(0.5))
+
+    def slowest(self, count=None):
+        """Letters with their stats, slowest p90 first"""
+        rows = [(char, *self.letter(char)) for char in self.times]
+        rows.sort(key=lambda row: row[3], reverse=True)
+        return rows[:count] if count else rows
+
+
+# Accuracy check against exact quantiles
+
+def check(samples=200000, seed=1):
+    rng = random.Random(seed)
+    distributions = {
+        'lognormal reaction (s)': lambda: rng.lognormvariate(-0.2, 0.5),
+        'uniform distance (px)': lambda: rng.uniform(0, 540),
+        'exponential': lambda: rng.expovariate(1.5),
+    }
+    worst_overall = 0.0
+    for name, draw in distributions.items():
+        values = [draw() for _ in range(samples)]
+        sketch = QuantileSketch()
+        start = time.perf_counter()
+        for value in values:
+            sketch.add(value)
+        add_us = (time.perf_counter() - start) / samples * 1e6
+        values.sort()
+        worst = 0.0
+        for q in (0.1, 0.5, 0.9, 0.99):
+            exact = values[int(q * (samples - 1))]
+            worst = max(worst, abs(sketch.quantile(q) - exact) / exact)
+        worst_overall = max(worst_overall, worst)
+        print(f"{name:<24} {len(sketch.buckets):4d} buckets  max rel. error {worst:.2%}  "
+              f"add {add_us:.2f} us")
+    return worst_overall <= RELATIVE_ACCURACY
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Quantile sketch accuracy check")
+    parser.add_argument('--samples', type=int, default=200000)
+    args = parser.parse_args()
+    raise SystemExit(0 if check(args.samples) else 1)
@@ -0,0 +1,208 @@
+import os
+import pygame
+
+try:
+    from pygame._sdl2.video import Window, Renderer, Texture, error as SDLError
+except ImportError:
+    Renderer = None
+
+WHITE = (255, 255, 255)
+
+# Derived images (scaled/tinted sprites, rendered strings) are cached until
+# there are this many, then the cache starts over
+VARIANT_LIMIT = 1024
+TEXT_LIMIT = 256
+
+BACKENDS = ('surface', 'texture', 'software')
+
+
+class Sprite:
+    """A static image owned by a backend: a Surface or an uploaded Texture"""
+    __slots__ = ('image', 'width', 'height')
+
+    def __init__(self, image, width, height):
+        self.image = image
+        self.width = width
+        self.height = height
+
+
+class SurfaceBackend:
+    """Draws with Surface blits onto the display surface (or any Surface).
+
+    Scaled and tinted versions of a sprite are made once and cached, so a
+    sprite drawn at the same size and color every frame costs one blit.
+    Alpha is applied per blit.
+    """
+
+    name = 'surface'
+
+    def __init__(self, screen):
+        self.screen = screen
+        self.offset = (0, 0)
+        self._sprites = {}
+        self._texts = {}
+        self._variants = {}
+
+    def _load(self, surface):
+        if pygame.display.get_surface():
+            # Match the display's pixel format so blits don't convert every time
+            surface = surface.convert_alpha() if surface.get_flags() & pygame.SRCALPHA else surface.convert()
+        return Sprite(surface, surface.get_width(), surface.get_height())
+
+    def sprite(self, key, build):
+        """Static image for key; build() returns its Surface on first use"""
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            sprite = self._sprites[key] = self._load(build())
+        return sprite
+
+    def upload(self, surface):
+        """Sprite for a Surface that lives as long as the game does"""
+        sprite = self._sprites.get(surface)
+        if sprite is None:
+            sprite = self._sprites[surface] = self._load(surface)
+        return sprite
+
+    def text(self, font, text, color=WHITE):
+        """Rendered string, kept until the text cache fills up"""
+        key = (font, text, color)
+        sprite = self._texts.get(key)
+        if sprite is None:
+            if len(self._texts) >= TEXT_LIMIT:
+                self._texts.clear()
+            sprite = self._texts[key] = self._load(font.render(text, True, color))
+        return sprite
+
+    def draw(self, sprite, center, size=None, alpha=255, color=None):
+        """Draw sprite centred on center"""
+        width, height = size or (sprite.width, sprite.height)
+        self.blit(sprite, (int(center[0]) - width // 2, int(center[1]) - height // 2),
+                  size, alpha, color)
+
+    def blit(self, sprite, pos, size=None, alpha=255, color=None):
+        """Draw sprite with its top-left corner at pos, optionally scaled to
+        size, faded to alpha and multiplied by color"""
+        image = sprite.image
+        if (size and size != (sprite.width, sprite.height)) or color:
+            key = (sprite, size, color)
+            variant = self._variants.get(key)
+            if variant is None:
+                if size and (size[0] <= 0 or size[1] <= 0):
+                    return
+                if len(self._variants) >= VARIANT_LIMIT:
+                    self._variants.clear()
+                if size and size != (sprite.width, sprite.height):
+                    variant = pygame.transform.smoothscale(image, size)
+                else:
+                    variant = image.copy()
+                if color:
+                    variant.fill((*color[:3], 255), special_flags=pygame.BLEND_RGBA_MULT)
+                self._variants[key] = variant
+            image = variant
+        # Surface alpha is sticky, so undo a previous fade; opaque surfaces
+        # report None and must stay that way to keep their fast blit path
+        if alpha != 255 or image.get_alpha() not in (None, 255):
+            image.set_alpha(alpha)
+        self.screen.blit(image, (pos[0] + self.offset[0], pos[1] + self.offset[1]))
+
+    def begin_frame(self):
+        pass
+
+    def present(self):
+        pygame.display.flip()
+
+    def present_screen(self):
+        """Show what was drawn on self.screen (menus)"""
+        pygame.display.flip()
+
+    def read_pixels(self):
+        """Copy of the frame drawn so far"""
+        return self.screen.copy()
+
+    def close(self):
+        self._sprites.clear()
+        self._texts.clear()
+        self._variants.clear()
+
+
+class TextureBackend(SurfaceBackend):
+    """Draws through pygame._sdl2's Renderer with textures uploaded once.
+
+    Scaling, alpha and color modulation are per-draw renderer state, so no
+    derived images are made at all. Works the same on SDL's software
+    renderer when there is no GPU.
+
+    Menus still draw with Surface calls onto self.screen, an offscreen
+    canvas that present_screen() uploads to a streaming texture.
+    """
+
+    name = 'texture'
+
+    def __init__(self, renderer, window):
+        super().__init__(pygame.Surface(window.size))
+        self.renderer = renderer
+        self.window = window
+        self._canvas = Texture(renderer, window.size, streaming=True)
+
+    def _load(self, surface):
+        texture = Texture.from_surface(self.renderer, surface)
+        return Sprite(texture, surface.get_width(), surface.get_height())
+
+    def blit(self, sprite, pos, size=None, alpha=255, color=None):
+        width, height = size or (sprite.width, sprite.height)
+        texture = sprite.image
+        texture.color = color or WHITE
+        texture.alpha = alpha
+        texture.draw(dstrect=(pos[0] + self.offset[0], pos[1] + self.offset[1], width, height))
+
+    def begin_frame(self):
+        self.renderer.draw_color = (0, 0, 0, 255)
+        self.renderer.clear()
+
+    def present(self):
+        self.renderer.present()
+
+    def present_screen(self):
+        self._canvas.update(self.screen)
+        self.renderer.clear()
+        self._canvas.draw()
+        self.renderer.present()
+
+    def read_pixels(self):
+        """Copy of the frame drawn so far (slow; for checks, not per frame)"""
+        return self.renderer.to_surface()
+
+    def close(self):
+        # Textures have to go before the renderer that owns them
+        super().close()
+        self._canvas = None
+        self.renderer = None
+        self.window.destroy()
+
+
+def create_backend(kind, size, caption):
+    """Open the game window with the named backend.
+
+    'texture' takes the best renderer SDL has (falling back to its software
+    renderer without a GPU), 'software' asks for the software renderer
+    outright. Anything that can't be set up falls back to 'surface'.
+    """
+    if kind != 'surface':
+        if Renderer is None:
+            print("Could not load pygame._sdl2, using the surface renderer")
+        else:
+            # Smooth scaling, like smoothscale on the surface path
+            os.environ.setdefault('SDL_RENDER_SCALE_QUALITY', 'linear')
+            window = None
+            try:
+                window = Window(caption, size)
+                renderer = Renderer(window, accelerated=0 if kind == 'software' else -1)
+                return TextureBackend(renderer, window)
+            except (pygame.error, SDLError) as e:
+                print(f"Could not create the {kind} renderer ({e}), using the surface renderer")
+                if window:
+                    window.destroy()
+
+    screen = pygame.display.set_mode(size)
+    pygame.display.set_caption(caption)
+    return SurfaceBackend(screen)
@@ -0,0 +1,166 @@
+import argparse
+import os
+import random
+import sys
+import time
+
+# Render backend benchmark and parity check.
+#
+# Draws the same seeded scene (background, falling letters through their
+# spawn and danger pulses, particles, fading floating texts, power-ups and
+# HUD text) for a fixed number of frames with each backend, timing every
+# frame. The last frame of each texture backend is read back and compared
+# with the surface backend's pixel by pixel. Exits non-zero when too many
+# pixels differ (--max-diff) or a texture backend couldn't be created.
+#
+#   python render_bench.py [--frames 300] [--letters 60] [--backends surface software]
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+
+from config import *
+from fonts import get_font
+from game_objects import Particle, FloatingText, PowerUp, FallingLetter, disc_surface
+from render import BACKENDS, create_backend
+from ui import DANGER_GLOW, danger_line_surface, gradient_surface
+
+# Share of pixels allowed to differ from the surface backend's frame by more
+# than DIFF_TOLERANCE in some channel. Scaling filters differ slightly at edges.
+MAX_DIFF = 0.005
+DIFF_TOLERANCE = 32
+
+
+def build_scene(letters, seed):
+    rng = random.Random(seed)
+    random.seed(seed)  # Particle velocities
+    font = get_font('Arial', 36, bold=True)
+    scene = {
+        'letters': [FallingLetter(rng.uniform(0.5, 2.0), rng) for _ in range(letters)],
+        'particles': [],
+        'texts': [],
+        'power_ups': [PowerUp(kind) for kind in ("slow", "time", "freeze")],
+        'font': font,
+        'small_font': get_font('Arial', 24),
+    }
+    for letter in scene['letters']:
+        letter.y = rng.uniform(-20, DANGER_LINE_Y)
+    for powerup in scene['power_ups']:
+        powerup.y = rng.uniform(0, DANGER_LINE_Y)
+    return scene
+
+
+def step_scene(scene, frame, dt=1 / 60):
+    for letter in scene['letters']:
+        letter.update(dt)
+        if letter.y > DANGER_LINE_Y:
+            letter.y = -20
+            letter.spawn_time = 0
+    for powerup in scene['power_ups']:
+        powerup.update()
+        powerup.y %= DANGER_LINE_Y
+    if frame % 10 == 0:
+        letter = scene['letters'][frame // 10 % len(scene['letters'])]
+        scene['particles'].extend(Particle(letter.x, letter.y, VIBRANT_CYAN) for _ in range(10))
+        scene['texts'].append(FloatingText(f"+{frame}", letter.x, letter.y, VIBRANT_GOLD, scene['font']))
+    for particle in scene['particles']:
+        particle.update(dt)
+    for text in scene['texts']:
+        text.update(dt)
+    scene['particles'] = [p for p in scene['particles'] if p.lifetime > 0]
+    scene['texts'] = [t for t in scene['texts'] if t.lifetime > 0]
+
+
+def draw_scene(backend, scene, frame):
+    backend.begin_frame()
+    backend.blit(backend.sprite('background', lambda: gradient_surface(
+        (SCREEN_WIDTH, SCREEN_HEIGHT), DARK_BG, DARK_BG2)), (0, 0))
+    dot = backend.sprite('disc', disc_surface)
+    for i in range(30):
+        backend.blit(dot, ((i * 27 + frame * 2) % SCREEN_WIDTH, (i * 20 + frame) % SCREEN_HEIGHT),
+                     (6, 6), 30 + i, VIBRANT_PURPLE)
+    backend.blit(backend.sprite('danger_line', danger_line_surface), (0, DANGER_LINE_Y - DANGER_GLOW))
+    for letter in scene['letters']:
+        letter.draw(backend)
+    for powerup in scene['power_ups']:
+        powerup.draw(backend, scene['font'])
+    for particle in scene['particles']:
+        particle.draw(backend)
+    for text in scene['texts']:
+        text.draw(backend)
+    backend.blit(backend.text(scene['font'], f"Score: {frame * 10:,}", VIBRANT_GOLD), (10, 10))
+    backend.blit(backend.text(scene['small_font'], f"Speed: {1 + frame % 20 / 10:.1f}x", VIBRANT_CYAN), (10, 90))
+
+
+def run(kind, frames=300, letters=60, seed=1):
+    """Time one backend over the scene; returns (name, frame times, last frame)"""
+    backend = create_backend(kind, (SCREEN_WIDTH, SCREEN_HEIGHT), "render bench")
+    scene = build_scene(letters, seed)
+    PowerUp.bake_sprites(scene['font'])
+    times = []
+    last = None
+    for frame in range(frames):
+        step_scene(scene, frame)
+        start = time.perf_counter()
+        draw_scene(backend, scene, frame)
+        if frame == frames - 1:
+            last = backend.read_pixels()
+        backend.present()
+        times.append(time.perf_counter() - start)
+    name = kind if backend.name == 'texture' else backend.name
+    backend.close()
+    return name, times, last
+
+
+def diff_share(a, b, tolerance=DIFF_TOLERANCE):
+    """Share of pixels where some channel differs by more than tolerance"""
+    a = a.convert(32)
+    b = b.convert(32)
+    diff = a.copy()
+    diff.blit(b, (0, 0), special_flags=pygame.BLEND_RGB_SUB)
+    under = b.copy()
+    under.blit(a, (0, 0), special_flags=pygame.BLEND_RGB_SUB)
+    diff.blit(under, (0, 0), special_flags=pygame.BLEND_RGB_ADD)
+    close = pygame.transform.threshold(None, diff, (0, 0, 0), (tolerance + 1,) * 3 + (255,), set_behavior=0)
+    return 1 - close / (diff.get_width() * diff.get_height())
+
+
+def report(results, max_diff=MAX_DIFF):
+    """Print timings and parity against the surface backend; return failures"""
+    failures = []
+    base_name, base_times, base_frame = results[0]
+    base_mean = sum(base_times) / len(base_times)
+    print(f"Render backends ({len(base_times)} frames):")
+    for name, times, frame in results:
+        ordered = sorted(times)
+        mean = sum(times) / len(times)
+        line = (f"  {name:<9} mean {mean * 1000:6.2f} ms  p95 {ordered[int(len(ordered) * 0.95)] * 1000:6.2f} ms"
+                f"  ({mean / base_mean:4.2f}x {base_name})")
+        if frame is not base_frame:
+            diff = diff_share(base_frame, frame)
+            ok = diff <= max_diff
+            if not ok:
+                failures.append(name)
+            line += f"  pixels off {diff:.2%} {'ok' if ok else 'FAIL'}"
+        print(line)
+    return failures
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Render backend benchmark and parity check")
+    parser.add_argument('--frames', type=int, default=300)
+    parser.add_argument('--letters', type=int, default=60)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--backends', nargs='+', choices=BACKENDS, default=['surface', 'software'])
+    parser.add_argument('--max-diff', type=float, default=MAX_DIFF)
+    args = parser.parse_args()
+
+    pygame.display.init()
+    pygame.font.init()
+    kinds = ['surface'] + [k for k in args.backends if k != 'surface']
+    results = [run(kind, args.frames, args.letters, args.seed) for kind in kinds]
+    failures = report(results, args.max_diff)
+    # A texture backend that fell back to surfaces can't be compared
+    failures += [kind for kind, (name, _, _) in zip(kinds[1:], results[1:]) if name == 'surface']
+    sys.exit(1 if failures else 0)
@@ -8,6 +8,7 @@ from config import ASSETS_DIR
 class SoundManager:
     def __init__(self):
         self.sounds = {}
+        self.dropped = 0
         self.load_assets()
         self.generate_synthetic_sounds()
 
@@ -115,5 +116,8 @@ class SoundManager:
         return pygame.mixer.Sound(buffer)
 
     def play(self, name):
-        if name in self.sounds:
-            self.sounds[name].play()
+        """Play a sound; returns False if it was dropped for lack of a free channel"""
+        if name in self.sounds and self.sounds[name].play() is None:
+            self.dropped += 1
+            return False
+        return True
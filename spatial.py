@@ -0,0 +1,162 @@
+import argparse
+import random
+import time
+from collections import defaultdict
+from config import SCREEN_WIDTH
+
+CELL_SIZE = 64
+HALF_HEIGHT = 25        # every falling object is roughly one glyph tall
+SPAWN_CLEARANCE = 70    # keep this much vertical room around a new spawn
+SPAWN_GAP = 10          # and this much horizontal room
+SPAWN_TRIES = 8
+
+
+class SpatialHash:
+    """Uniform grid over screen space for falling letters and power-ups.
+
+    Each object is filed under every cell its box touches. update() only
+    touches the grid when an object crosses a cell boundary, so keeping the
+    grid current costs O(1) per object per frame, and a box query only looks
+    at the handful of cells it overlaps regardless of how many objects exist.
+    """
+
+    def __init__(self, cell_size=CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = defaultdict(set)
+        self.spans = {}  # object -> (x0, y0, x1, y1) cell range it is filed under
+
+    def __len__(self):
+        return len(self.spans)
+
+    def __contains__(self, obj):
+        return obj in self.spans
+
+    def _span(self, left, top, right, bottom):
+        size = self.cell_size
+        return int(left // size), int(top // size), int(right // size), int(bottom // size)
+
+    def _object_span(self, obj):
+        return self._span(obj.x - obj.half_width, obj.y - HALF_HEIGHT,
+                          obj.x + obj.half_width, obj.y + HALF_HEIGHT)
+
+    @staticmethod
+    def _keys(span):
+        x0, y0, x1, y1 = span
+        return [(cx, cy) for cx in range(x0, x1 + 1) for cy in range(y0, y1 + 1)]
+
+    def insert(self, obj):
+        span = self._object_span(obj)
+        self.spans[obj] = span
+        for key in self._keys(span):
+            self.cells[key].add(obj)
+
+    def update(self, obj):
+        """Re-file obj after it moved; cheap when it stayed in the same cells"""
+        span = self._object_span(obj)
+        old = self.spans.get(obj)
+        if span == old:
+            return
+        if old:
+            self._discard(obj, old)
+        self.spans[obj] = span
+        for key in self._keys(span):
+            self.cells[key].add(obj)
+
+    def remove(self, obj):
+        span = self.spans.pop(obj, None)
+        if span:
+            self._discard(obj, span)
+
+    def _discard(self, obj, span):
+        for key in self._keys(span):
+            cell = self.cells[key]
+            cell.discard(obj)
+            if not cell:
+                del self.cells[key]
+
+    def query(self, left, top, right, bottom):
+        """Objects whose cells overlap the box (a superset of true overlaps)"""
+        found = set()
+        cells = self.cells
+        for key in self._keys(self._span(left, top, right, bottom)):
+            cell = cells.get(key)
+            if cell:
+                found |= cell
+        return found
+
+    def neighbors(self, x, y, radius):
+        """Objects whose centre lies within radius of (x, y)"""
+        r2 = radius * radius
+        return [obj for obj in self.query(x - radius, y - radius, x + radius, y + radius)
+                if (obj.x - x) ** 2 + (obj.y - y) ** 2 <= r2]
+
+    def crowding(self, x, y, half_width):
+        """How many objects sit in the spawn box around (x, y)"""
+        return len(self.query(x - half_width - SPAWN_GAP, y - SPAWN_CLEARANCE,
+                              x + half_width + SPAWN_GAP, y + SPAWN_CLEARANCE))
+
+    def find_spawn_x(self, preferred_x, y, half_width, rng=random, tries=SPAWN_TRIES):
+        """Pick an x for a new object that doesn't overlap anything on screen.
+
+        The preferred x (the object's own random pick) is tried first so spawn
+        streams stay reproducible when there is room; after that a few random
+        columns are probed and the least crowded one wins.
+        """
+        lo = max(50, half_width)
+        hi = max(lo, SCREEN_WIDTH - lo)
+        best_x = preferred_x
+        best = self.crowding(preferred_x, y, half_width)
+        for _ in range(tries):
+            if best == 0:
+                break
+            x = rng.randint(lo, hi)
+            count = self.crowding(x, y, half_width)
+            if count < best:
+                best_x, best = x, count
+        return best_x
+
+
+# Stress run: thousands of falling objects, timing per-frame upkeep and spawns
+
+class _Dummy:
+    def __init__(self, rng, height):
+        self.x = rng.randint(50, SCREEN_WIDTH - 50)
+        self.y = rng.uniform(-20, height)
+        self.half_width = 20
+        self.speed = rng.uniform(1, 3)
+
+
+def stress(count=5000, frames=300, height=20000):
+    rng = random.Random(0)
+    grid = SpatialHash()
+    objects = [_Dummy(rng, height) for _ in range(count)]
+    for obj in objects:
+        grid.insert(obj)
+
+    update_time = spawn_time = 0.0
+    for _ in range(frames):
+        start = time.perf_counter()
+        for obj in objects:
+            obj.y = (obj.y + obj.speed) % height
+            grid.update(obj)
+        update_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        obj = objects[rng.randrange(count)]
+        obj.y = -20
+        obj.x = grid.find_spawn_x(obj.x, obj.y, obj.half_width, rng)
+        grid.update(obj)
+        spawn_time += time.perf_counter() - start
+
+    print(f"{count} objects, {frames} frames")
+    print(f"  grid upkeep: {update_time / frames * 1000:.2f} ms/frame "
+          f"({update_time / frames / count * 1e6:.2f} us/object)")
+    print(f"  spawn placement: {spawn_time / frames * 1e6:.1f} us/spawn")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Spatial hash stress run")
+    parser.add_argument('--objects', type=int, default=5000)
+    parser.add_argument('--frames', type=int, default=300)
+    args = parser.parse_args()
+    stress(args.objects, args.frames)
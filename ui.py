@@ -3,25 +3,11 @@ import math
 import time
 from config import *
 from utils import lerp
+from fonts import get_font
+
+# Fonts are created lazily through fonts.get_font, which caches both the
+# Font objects and the resolved font file paths (see fonts.py).
 
-# Fonts
-# We initialize fonts here, but pygame.init() must be called before importing this module
-# or we wrap initialization. Since main.py calls pygame.init() first, this is risky if imported at top level.
-# Better to initialize fonts in a function or class.
-# However, for simplicity in this refactor, we'll assume pygame is initialized.
-# To be safe, let's lazy load or initialize in a function.
-# But `main.py` imports `ui` *after* `pygame.init()` usually? No, imports happen at top.
-# So `pygame.init()` in `main.py` happens *after* imports.
-# This means `pygame.font.SysFont` will fail at import time if pygame isn't initialized.
-# We should wrap font creation.
-
-_fonts = {}
-
-def get_font(name, size, bold=False):
-    key = (name, size, bold)
-    if key not in _fonts:
-        _fonts[key] = pygame.font.SysFont(name, size, bold=bold)
-    return _fonts[key]
 
 def draw_gradient_rect(surface, rect, color1, color2, vertical=True):
     """Draw a gradient rectangle"""
@@ -49,6 +35,34 @@ def draw_gradient_rect(surface, rect, color1, color2, vertical=True):
                            (rect.x + x, rect.y + rect.height))
 
 
+def gradient_surface(size, color1, color2, vertical=True):
+    """Gradient baked into a Surface, for drawing as a sprite"""
+    surf = pygame.Surface(size)
+    draw_gradient_rect(surf, surf.get_rect(), color1, color2, vertical)
+    return surf
+
+
+DANGER_GLOW = 10
+REACTION_ROWS = 7  # letters listed on the results screen
+
+
+def danger_line_surface():
+    """The danger line and its glow, DANGER_GLOW px above DANGER_LINE_Y"""
+    surf = pygame.Surface((SCREEN_WIDTH, DANGER_GLOW + 4), pygame.SRCALPHA)
+    for i in range(DANGER_GLOW):
+        alpha = int(100 * (1 - i / DANGER_GLOW))
+        pygame.draw.line(surf, (*DANGER_RED[:3], alpha), (0, DANGER_GLOW - i), (SCREEN_WIDTH, DANGER_GLOW - i), 2)
+    pygame.draw.line(surf, DANGER_RED, (0, DANGER_GLOW), (SCREEN_WIDTH, DANGER_GLOW), 4)
+    return surf
+
+
+def bar_surface(width, height):
+    """Rounded timer bar background"""
+    surf = pygame.Surface((width, height), pygame.SRCALPHA)
+    pygame.draw.rect(surf, DARK_BG2, surf.get_rect(), border_radius=10)
+    return surf
+
+
 def draw_glow_text(surface, text, pos, font, color, glow_color):
     """Draw text with glow effect"""
     # Draw glow layers
@@ -66,7 +80,17 @@ def draw_glow_text(surface, text, pos, font, color, glow_color):
     surface.blit(text_surf, pos)
 
 
-def show_start_screen(screen, clock, sound_manager):
+def draw_glow_sprite(backend, sprite, pos, size, color, glow_color):
+    """draw_glow_text for a render backend: one white text sprite, tinted"""
+    for offset in range(3, 0, -1):
+        glow_alpha = int(100 / offset)
+        for dx, dy in ((-1, -1), (1, -1), (-1, 1), (1, 1)):
+            backend.blit(sprite, (pos[0] + dx * offset, pos[1] + dy * offset), size, glow_alpha, glow_color)
+    backend.blit(sprite, pos, size, color=color)
+
+
+def show_start_screen(screen, clock, sound_manager, on_first_frame=None, summary=None,
+                      present=pygame.display.flip):
     """Display start screen with difficulty selection"""
     # Initialize fonts if needed (or use get_font)
     title_font_dynamic = get_font('Arial', 72, bold=True) # Placeholder size, will scale
@@ -74,6 +98,16 @@ def show_start_screen(screen, clock, sound_manager):
 
     title_pulse = 0
 
+    # Player history line, rendered once (summary comes from SessionHistory)
+    history_text = None
+    if summary and summary['totals']:
+        bests = "  ".join(f"{diff.upper()} {totals['best_score']:,}"
+                          for diff, totals in sorted(summary['totals'].items()))
+        line = f"Best: {bests}"
+        if summary['weakest']:
+            line += f"   Practice: {', '.join(summary['weakest'])}"
+        history_text = small_font.render(line, True, VIBRANT_GOLD)
+
     while True:
         dt = clock.tick(60) / 1000.0
         title_pulse = (title_pulse + dt) % (2 * math.pi)
@@ -94,11 +128,8 @@ def show_start_screen(screen, clock, sound_manager):
         # Title with pulsing effect
         title_scale = 1.0 + 0.1 * math.sin(title_pulse)
         title_size = int(72 * title_scale)
-        # We need to recreate font for smooth scaling or scale surface?
-        # Recreating font is cleaner for text but slower.
-        # Let's use get_font to cache sizes if possible, but continuous scaling fills cache.
-        # For this refactor, let's just create it.
-        current_title_font = pygame.font.SysFont('Arial', title_size, bold=True)
+        # title_size only spans a handful of integer sizes, so caching them is bounded
+        current_title_font = get_font('Arial', title_size, bold=True)
 
         draw_glow_text(screen, "DROP GAME",
                       (SCREEN_WIDTH // 2 - 150, 80),
@@ -155,7 +186,14 @@ def show_start_screen(screen, clock, sound_manager):
                        (rect.centerx - button_text.get_width() // 2,
                         rect.centery - button_text.get_height() // 2))
 
-        pygame.display.flip()
+        if history_text:
+            screen.blit(history_text, (SCREEN_WIDTH // 2 - history_text.get_width() // 2, 555))
+
+        present()
+
+        if on_first_frame:
+            on_first_frame()
+            on_first_frame = None
 
         # Event handling
         for event in pygame.event.get():
@@ -174,7 +212,8 @@ def show_start_screen(screen, clock, sound_manager):
 
 
 def show_results_screen(screen, clock, sound_manager, correct_count, mistake_count,
-                       typed_mistakes, missed_letters, max_combo, total_score):
+                       typed_mistakes, missed_letters, max_combo, total_score,
+                       summary=None, difficulty=None, present=pygame.display.flip, reactions=None):
     """Display enhanced results screen"""
     results_font = get_font('Arial', 48, bold=True)
     font = get_font('Arial', 36, bold=True)
@@ -186,6 +225,23 @@ def show_results_screen(screen, clock, sound_manager, correct_count, mistake_cou
 
     sound_manager.play('game_over')
 
+    # History line from the precomputed aggregates
+    history_text = None
+    totals = summary['totals'].get(difficulty) if summary else None
+    if totals:
+        line = f"Best ({difficulty.upper()}): {totals['best_score']:,}  |  Games: {totals['sessions']}"
+        if summary['trend'] is not None:
+            line += f"  |  vs recent avg: {summary['trend']:+,.0f}"
+        history_text = small_font.render(line, True, VIBRANT_GOLD)
+
+    # Reaction times per letter (p50 / p90 from the session's sketches), slowest first
+    reaction_rows = []
+    if reactions and reactions.times:
+        reaction_rows.append(small_font.render("Reaction p50/p90", True, VIBRANT_CYAN))
+        for char, hits, p50, p90, distance in reactions.slowest(REACTION_ROWS):
+            reaction_rows.append(small_font.render(
+                f"{char}  {p50:.2f} / {p90:.2f}s  {distance:.0f}px", True, WHITE))
+
     # Need ease_out_cubic, import it or pass it? Imported from utils.
     from utils import ease_out_cubic
 
@@ -226,6 +282,9 @@ def show_results_screen(screen, clock, sound_manager, correct_count, mistake_cou
             screen.blit(text, (SCREEN_WIDTH // 2 - text.get_width() // 2, stats_y))
             stats_y += 50
 
+        for i, row in enumerate(reaction_rows):
+            screen.blit(row, (20, 200 + i * 26))
+
         # Performance feedback
         if typed_mistakes:
             most_common_mistake = max(typed_mistakes, key=typed_mistakes.get)
@@ -243,11 +302,14 @@ def show_results_screen(screen, clock, sound_manager, correct_count, mistake_cou
             screen.blit(miss_feedback,
                        (SCREEN_WIDTH // 2 - miss_feedback.get_width() // 2, 440))
 
+        if history_text:
+            screen.blit(history_text, (SCREEN_WIDTH // 2 - history_text.get_width() // 2, 480))
+
         # Exit prompt
         prompt_text = small_font.render("Press any key to exit", True, VIBRANT_CYAN)
         screen.blit(prompt_text, (SCREEN_WIDTH // 2 - prompt_text.get_width() // 2, 520))
 
-        pygame.display.flip()
+        present()
 
         # Event handling
         for event in pygame.event.get():
@@ -7,3 +7,7 @@ def lerp(start, end, t):
 def ease_out_cubic(t):
     """Easing function for smooth animations"""
     return 1 - pow(1 - t, 3)
+
+def hit_points(combo, length=1):
+    """Points for a hit at the given combo; words score per character"""
+    return int(10 * (1 + combo * 0.1) * length)
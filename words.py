@@ -0,0 +1,123 @@
+import os
+from config import WORD_LIST_PATH
+
+MAX_WORD_LENGTH = 12
+
+
+def load_word_list(path=WORD_LIST_PATH, min_length=2, max_length=MAX_WORD_LENGTH):
+    """Load a word list (one word per line), keeping only plain A-Z words"""
+    if not os.path.exists(path):
+        print(f"Could not find word list {path}")
+        return []
+    with open(path, 'r', encoding='utf-8') as f:
+        data = f.read().upper()
+    # A single split() over the whole file keeps 100k-entry dictionaries fast to load
+    return [w for w in data.split()
+            if min_length <= len(w) <= max_length and w.isascii() and w.isalpha()]
+
+
+class _TrieNode:
+    __slots__ = ('children', 'words', 'ending')
+
+    def __init__(self):
+        self.children = {}
+        self.words = set()   # every active word in this subtree
+        self.ending = []     # active words that end exactly here
+
+
+class WordMatcher:
+    """Incremental prefix matcher over the words currently on screen.
+
+    Active words live in a trie keyed by their text. The typed prefix is kept
+    as the path of trie nodes it walked, so a keystroke is a single dict
+    lookup and the words sharing the prefix are simply `path[-1].words` -
+    independent of how many words are falling.
+    """
+
+    def __init__(self):
+        self.root = _TrieNode()
+        self.reset()
+
+    @property
+    def typed(self):
+        return ''.join(self._typed_chars)
+
+    @property
+    def highlighted(self):
+        """Active words that start with the typed prefix"""
+        return self.path[-1].words if len(self.path) > 1 else frozenset()
+
+    def add(self, word):
+        node = self.root
+        node.words.add(word)
+        for ch in word.char:
+            node = node.children.setdefault(ch, _TrieNode())
+            node.words.add(word)
+        node.ending.append(word)
+
+    def remove(self, word):
+        node = self.root
+        node.words.discard(word)
+        for ch in word.char:
+            child = node.children[ch]
+            child.words.discard(word)
+            if not child.words:
+                # Prune the now-empty branch; nothing below it is active either
+                del node.children[ch]
+                break
+            node = child
+        else:
+            node.ending.remove(word)
+
+        # The word we were typing may have just disappeared
+        if not self.path[-1].words:
+            self.reset()
+
+    def type_char(self, ch):
+        """Advance the typed prefix by one character.
+
+        Returns ("complete", word) when a whole word was typed, ("partial", None)
+        when the prefix still matches something, and ("miss", None) otherwise.
+        A word completes by itself only when no longer active word continues
+        it; otherwise it waits for submit(). A character that doesn't continue
+        the prefix starts over from the root, so switching words is no miss.
+        """
+        child = self.path[-1].children.get(ch)
+        if child is None and len(self.path) > 1:
+            self.reset()
+            child = self.root.children.get(ch)
+        if child is None:
+            self.reset()
+            return "miss", None
+
+        self.path.append(child)
+        self._typed_chars.append(ch)
+        if child.ending and not child.children:
+            return self._complete(child)
+        return "partial", None
+
+    def submit(self):
+        """Complete the word typed so far (for words that prefix a longer one)"""
+        node = self.path[-1]
+        if len(self.path) == 1:
+            return "partial", None
+        if not node.ending:
+            self.reset()
+            return "miss", None
+        return self._complete(node)
+
+    def _complete(self, node):
+        # Several copies of the same word: take the most dangerous one
+        word = max(node.ending, key=lambda w: w.y)
+        self.remove(word)
+        self.reset()
+        return "complete", word
+
+    def backspace(self):
+        if len(self.path) > 1:
+            self.path.pop()
+            self._typed_chars.pop()
+
+    def reset(self):
+        self.path = [self.root]
+        self._typed_chars = []